@@ -533,7 +533,7 @@ def reformat_references():
         
         # Import reference validator
         from src.agents.reference_validator import ReferenceValidator
-        validator = ReferenceValidator()
+        validator = ReferenceValidator(cache_path=None)  # Formatting only, no CrossRef lookups
         
         # Create a mock result object with the references
         class MockResult:
@@ -557,6 +557,7 @@ def run_reference_validation(content: str, file_format: str, options: dict):
     """Run reference validation in a separate thread."""
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
+    validator = None
     
     try:
         # Import reference validator
@@ -740,6 +741,8 @@ def run_reference_validation(content: str, file_format: str, options: dict):
         raise e
         
     finally:
+        if validator is not None:
+            validator.close()
         loop.close()
 
 
@@ -778,6 +781,7 @@ def run_literature_generation(topic: str, filters: dict):
     """Run literature generation in a separate thread."""
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
+    literature_agent = None
     
     try:
         # Get research system and run research
@@ -833,6 +837,8 @@ def run_literature_generation(topic: str, filters: dict):
         raise e
         
     finally:
+        if literature_agent is not None:
+            literature_agent.close()
         loop.close()
 
 
@@ -13,13 +13,26 @@ from ..models.data_models import PaperMetadata, TopicMap
 from .base_agent import BaseAgent
 
 
+_HIGH_IMPACT_VENUES_LC = (
+    "nature", "science", "cell", "nejm", "lancet",
+    "iclr", "neurips", "icml", "aaai", "ijcai"
+)
+
+
 class EnhancedPaperDiscoveryAgent(BaseAgent):
     """Enhanced agent that searches multiple academic databases."""
     
-    def __init__(self, memory_store=None, max_papers_per_source: int = 50):
+    def __init__(
+        self,
+        memory_store=None,
+        max_papers_per_source: int = 50,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         super().__init__("EnhancedPaperDiscoveryAgent", memory_store)
         self.max_papers_per_source = max_papers_per_source
-        self.session = None
+        # A caller-provided session is shared and left open; one opened by `async with` is ours
+        self.session = session
+        self._owns_session = False
         
         # API configurations
         self.apis = {
@@ -68,12 +81,16 @@ class EnhancedPaperDiscoveryAgent(BaseAgent):
         }
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
+            self.session = None
+            self._owns_session = False
     
     async def process(self, topic_map: TopicMap) -> List[PaperMetadata]:
         """
@@ -85,8 +102,11 @@ class EnhancedPaperDiscoveryAgent(BaseAgent):
             "enabled_sources": [name for name, config in self.apis.items() if config["enabled"]]
         })
         
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        if self.session is None or self.session.closed:
+            raise RuntimeError(
+                "EnhancedPaperDiscoveryAgent needs an open session: "
+                "use 'async with agent:' or pass session="
+            )
         
         all_papers = []
         
@@ -163,7 +183,8 @@ class EnhancedPaperDiscoveryAgent(BaseAgent):
         try:
             async with self.session.get(url, params=params) as response:
                 if response.status == 200:
-                    content = await response.text()
+                    # Raw bytes go straight to expat; no decode/re-encode round trip
+                    content = await response.read()
                     papers = self._parse_arxiv_response(content)
         except Exception as e:
             self.logger.error(f"ArXiv search error: {e}")
@@ -322,12 +343,12 @@ class EnhancedPaperDiscoveryAgent(BaseAgent):
         
         return papers
     
-    def _parse_arxiv_response(self, xml_content: str) -> List[PaperMetadata]:
+    def _parse_arxiv_response(self, xml_bytes: bytes) -> List[PaperMetadata]:
         """Parse ArXiv API XML response (existing implementation)."""
         papers = []
         
         try:
-            root = ET.fromstring(xml_content)
+            root = ET.fromstring(xml_bytes)
             namespace = {"atom": "http://www.w3.org/2005/Atom"}
             
             for entry in root.findall("atom:entry", namespace):
@@ -569,6 +590,10 @@ class EnhancedPaperDiscoveryAgent(BaseAgent):
     
     def _rank_papers(self, papers: List[PaperMetadata], topic_map: TopicMap) -> List[PaperMetadata]:
         """Rank papers by relevance, impact, and recency."""
+        # Topic-derived values are the same for every paper; compute them once
+        main_topic_lc = topic_map.main_topic.lower()
+        keywords_lc = [keyword.lower() for keyword in topic_map.keywords]
+        current_year = datetime.now().year
         
         def calculate_relevance_score(paper: PaperMetadata) -> float:
             score = 0.0
@@ -576,20 +601,19 @@ class EnhancedPaperDiscoveryAgent(BaseAgent):
             abstract_lower = paper.abstract.lower()
             
             # Main topic match
-            if topic_map.main_topic.lower() in title_lower:
+            if main_topic_lc in title_lower:
                 score += 0.3
-            if topic_map.main_topic.lower() in abstract_lower:
+            if main_topic_lc in abstract_lower:
                 score += 0.2
             
             # Keyword matches
-            for keyword in topic_map.keywords:
-                if keyword.lower() in title_lower:
+            for keyword_lc in keywords_lc:
+                if keyword_lc in title_lower:
                     score += 0.1
-                if keyword.lower() in abstract_lower:
+                if keyword_lc in abstract_lower:
                     score += 0.05
             
             # Recency bonus
-            current_year = datetime.now().year
             if current_year - paper.year <= 5:
                 score += 0.1 * (6 - (current_year - paper.year)) / 5
             
@@ -598,11 +622,8 @@ class EnhancedPaperDiscoveryAgent(BaseAgent):
                 score += min(paper.impact_score / 100, 0.2)
             
             # Venue impact (simplified)
-            high_impact_venues = [
-                "Nature", "Science", "Cell", "NEJM", "Lancet",
-                "ICLR", "NeurIPS", "ICML", "AAAI", "IJCAI"
-            ]
-            if any(venue.lower() in paper.venue.lower() for venue in high_impact_venues):
+            venue_lower = paper.venue.lower()
+            if any(venue in venue_lower for venue in _HIGH_IMPACT_VENUES_LC):
                 score += 0.2
             
             return min(score, 1.0)
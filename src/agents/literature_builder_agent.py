@@ -9,21 +9,33 @@ import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 import re
 from datetime import datetime
 
 # Import requests with fallback
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
+# Import aiohttp with fallback
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 # Try relative imports first, then absolute
 try:
     from ..models.data_models import (
         Claim, PaperMetadata, ResearchResults, TopicMap, ClaimCluster,
         LiteratureSection, LiteratureOutline, LiteratureDocument, LiteratureFilter
     )
+    from ..memory.doi_cache import DEFAULT_CACHE_DIR, DOICache
 except ImportError:
     # Fallback to absolute imports for testing
     import sys
@@ -33,13 +45,170 @@ except ImportError:
         Claim, PaperMetadata, ResearchResults, TopicMap, ClaimCluster,
         LiteratureSection, LiteratureOutline, LiteratureDocument, LiteratureFilter
     )
+    from memory.doi_cache import DEFAULT_CACHE_DIR, DOICache
 
 logger = logging.getLogger(__name__)
 
+_VENUE_TOKEN_RE = re.compile(r'\W+')
+
+# Abstract-to-literature patterns, compiled once at import
+_SENT_RE = re.compile(r'[^.!?]+')  # Sentence bodies between terminators
+_MIN_ABSTRACT_CHARS = 30  # Shorter abstracts cannot yield a usable sentence
+_MAX_CLEAN_SENTENCES = 5  # At most sentences 2-4 are used, so stop scanning after 5
+_WE_RE = re.compile(r'\bwe\b', re.IGNORECASE)
+_OUR_RE = re.compile(r'\bour\b', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+# Common abstract prefixes/suffixes and research-paper phrases to strip
+_ABSTRACT_PREFIXES = (
+    "Abstract:", "ABSTRACT:", "Summary:", "SUMMARY:",
+    "Background:", "BACKGROUND:", "Objective:", "OBJECTIVE:",
+    "Purpose:", "PURPOSE:", "Introduction:", "INTRODUCTION:",
+    "Methods:", "METHODS:", "Results:", "RESULTS:",
+    "Conclusion:", "CONCLUSION:", "Conclusions:", "CONCLUSIONS:"
+)
+_ABSTRACT_SUFFIXES = (
+    "© 2023", "© 2024", "© 2025", "All rights reserved",
+    "Keywords:", "KEYWORDS:", "Key words:", "KEY WORDS:",
+    "Funding:", "FUNDING:", "Acknowledgments:", "ACKNOWLEDGMENTS:",
+    "Conflict of interest:", "CONFLICT OF INTEREST:",
+    "Author contributions:", "AUTHOR CONTRIBUTIONS:"
+)
+_ABSTRACT_SUFFIX_RE = re.compile('|'.join(map(re.escape, _ABSTRACT_SUFFIXES)))
+_SKIP_PHRASES = (
+    "in this paper", "in this study", "in this work", "we present",
+    "we propose", "we show", "we demonstrate", "our results",
+    "our findings", "our approach", "our method", "this paper",
+    "this study", "this work", "the present study"
+)
+_SKIP_RE = re.compile('|'.join(map(re.escape, _SKIP_PHRASES)), re.IGNORECASE)
+
+# Proper nouns kept capitalized in titles (lowercase -> display form), matched in a single pass
+_PROPER_NOUNS = {
+    "wiener": "Wiener", "euler": "Euler", "hamilton": "Hamilton", "fibonacci": "Fibonacci",
+    "pascal": "Pascal", "newton": "Newton", "gauss": "Gauss", "fourier": "Fourier",
+    "laplace": "Laplace", "bayes": "Bayes", "markov": "Markov", "poisson": "Poisson",
+    "bernoulli": "Bernoulli", "covid": "COVID", "sars": "SARS", "hiv": "HIV",
+    "aids": "AIDS", "dna": "DNA", "rna": "RNA", "pcr": "PCR", "crispr": "CRISPR"
+}
+_PROPER_NOUNS_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, _PROPER_NOUNS)) + r')\b', re.IGNORECASE
+)
+
+# Volume/issue patterns found in venue strings, e.g. "vol. 25, no. 3" or "25(3)"
+_VOLUME_RE = re.compile(r'vol(?:ume)?\.?\s*(\d+)')
+_ISSUE_RE = re.compile(r'(?:no|issue)\.?\s*(\d+)')
+_VOL_ISSUE_RE = re.compile(r'(\d+)\((\d+)\)')
+
+# CrossRef works endpoint; filter=doi: queries accept many DOIs per request
+_CROSSREF_WORKS_URL = "https://api.crossref.org/works"
+_CROSSREF_BATCH_SIZE = 100
+_DOI_PREFIX_RE = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', re.IGNORECASE)
+_CROSSREF_CONCURRENCY = 8
+# Persistent DOI -> volume info cache
+_DOI_CACHE_PATH = str(DEFAULT_CACHE_DIR / "crossref_cache.sqlite")
+_CROSSREF_HEADERS = {
+    'User-Agent': 'Research System/1.0 (mailto:research@example.com)',
+    'Accept': 'application/json'
+}
+
+# Paper count above which classification is spread over a process pool
+_PARALLEL_CLASSIFY_THRESHOLD = 1000
+
+
+@lru_cache(maxsize=4096)
+def _normalize_doi(doi: str) -> str:
+    """Strip URL/scheme prefixes from a DOI and lowercase it (DOIs are case-insensitive)."""
+    return _DOI_PREFIX_RE.sub('', doi.strip()).lower()
+
+
+@lru_cache(maxsize=8192)
+def _format_author(author: str) -> str:
+    """Format one author name as "F.M. Last" (cached, since authors recur across papers)."""
+    author = author.strip()
+    parts = author.split()
+    
+    if len(parts) < 2:
+        return author
+    
+    # Check if author is already in correct format (e.g., "Y. Saad", "M.H. Schultz")
+    if len(parts) == 2 and len(parts[0]) <= 4 and '.' in parts[0]:
+        return author
+    
+    # Last part is last name, everything else is first/middle names
+    last_name = parts[-1]
+    
+    # Create initials, keeping names that already end with a period
+    initials = [
+        name if name.endswith('.') else f"{name[0].upper()}."
+        for name in parts[:-1]
+        if name[0].isalpha()
+    ]
+    
+    # Format as "F.M. Last" (initials first, then last name)
+    if initials:
+        return f"{''.join(initials)} {last_name}"
+    return last_name
+
+
+def _rank_venue(
+    venue_lower: str,
+    venue_rank: Dict[str, str],
+    venue_phrases: List[Tuple[str, str]]
+) -> str:
+    """Return the best Q-rank matched by the venue's word tokens (Q3 by default)."""
+    q_rank = 'Q3'  # Default
+    if not venue_lower:
+        return q_rank
+    
+    for token in _VENUE_TOKEN_RE.split(venue_lower):
+        rank = venue_rank.get(token)
+        if rank and rank < q_rank:
+            q_rank = rank
+            if q_rank == 'Q1':
+                return q_rank
+    
+    for phrase, rank in venue_phrases:
+        if rank < q_rank and phrase in venue_lower:
+            q_rank = rank
+    
+    return q_rank
+
+
+def _classify_one(
+    paper: PaperMetadata,
+    venue_rank: Dict[str, str],
+    venue_phrases: List[Tuple[str, str]],
+    sa_keywords: List[str]
+) -> Tuple[str, Dict[str, Any]]:
+    """Classify a single paper by Q-ranking and SA status.
+    
+    Kept at module level so it can be pickled into worker processes.
+    """
+    venue_lower = paper.venue.lower() if paper.venue else ""
+    title_lower = paper.title.lower() if paper.title else ""
+    abstract_lower = paper.abstract.lower() if paper.abstract else ""
+    
+    # Determine SA status
+    is_sa = any(keyword in title_lower or keyword in abstract_lower 
+               for keyword in sa_keywords)
+    
+    return paper.id, {
+        'q_rank': _rank_venue(venue_lower, venue_rank, venue_phrases),
+        'is_sa': is_sa,
+        'venue': paper.venue,
+        'year': paper.year
+    }
+
+
 class LiteratureBuilderAgent:
     """Agent responsible for building structured academic literature from claims."""
     
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = _DOI_CACHE_PATH):
+        """
+        Args:
+            cache_path: SQLite file caching CrossRef volume info across runs, or None to disable it
+        """
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.q_rankings = {
             'Q1': ['nature', 'science', 'cell', 'lancet', 'nejm', 'jama', 'pnas'],
@@ -50,6 +219,36 @@ class LiteratureBuilderAgent:
             'systematic review', 'meta-analysis', 'literature review',
             'survey', 'comprehensive review', 'systematic analysis'
         ]
+        # Flattened venue -> rank lookup: single-word venues are matched per token,
+        # multi-word venues fall back to a substring scan
+        self._venue_rank = {}
+        self._venue_phrases = []
+        for rank, venues in self.q_rankings.items():
+            for venue in venues:
+                if ' ' in venue:
+                    self._venue_phrases.append((venue, rank))
+                else:
+                    self._venue_rank.setdefault(venue, rank)
+        
+        # CrossRef HTTP session, created on first use so connections are kept alive
+        self._crossref_session = None
+        
+        # Persistent DOI -> volume info cache shared across runs
+        self._doi_cache = None
+        if cache_path is not None:
+            try:
+                self._doi_cache = DOICache(cache_path)
+            except Exception as e:
+                self.logger.warning(f"DOI cache unavailable, CrossRef lookups will not be cached: {str(e)}")
+    
+    def close(self) -> None:
+        """Release the DOI cache connection and the CrossRef HTTP session."""
+        if self._doi_cache is not None:
+            self._doi_cache.close()
+            self._doi_cache = None
+        if self._crossref_session is not None:
+            self._crossref_session.close()
+            self._crossref_session = None
     
     async def process(self, research_results: ResearchResults) -> LiteratureDocument:
         """
@@ -65,6 +264,7 @@ class LiteratureBuilderAgent:
         
         try:
             # Step 1: Classify papers by Q-ranking and SA status
+            self._ensure_ids(research_results.papers)
             classified_papers = self._classify_papers(research_results.papers)
             
             # Step 2: Cluster claims by themes and methods
@@ -86,7 +286,7 @@ class LiteratureBuilderAgent:
             sections = await self._build_sections(claim_clusters, outline)
             
             # Step 5: Generate bibliography
-            bibliography = self._generate_bibliography(research_results.papers)
+            bibliography = await self._generate_bibliography(research_results.papers)
             
             # Step 6: Create final document
             document = LiteratureDocument(
@@ -112,35 +312,31 @@ class LiteratureBuilderAgent:
             self.logger.error(f"Error in literature building: {str(e)}")
             raise e
     
+    def _ensure_ids(self, papers: List[PaperMetadata]) -> None:
+        """Assign a stable id to any paper that lacks one, so lookups can read paper.id directly."""
+        for paper in papers:
+            if not paper.id:
+                paper.id = f"paper_{hash(paper.title)}"
+    
     def _classify_papers(self, papers: List[PaperMetadata]) -> Dict[str, Dict[str, Any]]:
         """Classify papers by Q-ranking and SA status."""
-        classified = {}
+        classify = partial(
+            _classify_one,
+            venue_rank=self._venue_rank,
+            venue_phrases=self._venue_phrases,
+            sa_keywords=self.sa_keywords
+        )
         
-        for paper in papers:
-            paper_id = getattr(paper, 'id', f"paper_{hash(paper.title)}")
-            venue_lower = paper.venue.lower() if paper.venue else ""
-            title_lower = paper.title.lower() if paper.title else ""
-            abstract_lower = paper.abstract.lower() if paper.abstract else ""
-            
-            # Determine Q-ranking
-            q_rank = 'Q3'  # Default
-            for rank, venues in self.q_rankings.items():
-                if any(venue in venue_lower for venue in venues):
-                    q_rank = rank
-                    break
-            
-            # Determine SA status
-            is_sa = any(keyword in title_lower or keyword in abstract_lower 
-                       for keyword in self.sa_keywords)
-            
-            classified[paper_id] = {
-                'q_rank': q_rank,
-                'is_sa': is_sa,
-                'venue': paper.venue,
-                'year': paper.year
-            }
+        # Classification is pure per-paper work, so large corpora are fanned out
+        # across processes; small inputs stay serial to avoid pool start-up cost
+        if len(papers) > _PARALLEL_CLASSIFY_THRESHOLD:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    return dict(executor.map(classify, papers, chunksize=128))
+            except Exception as e:
+                self.logger.warning(f"Parallel paper classification failed, falling back to serial: {str(e)}")
         
-        return classified
+        return dict(map(classify, papers))
     
     async def _cluster_claims(
         self, 
@@ -152,30 +348,30 @@ class LiteratureBuilderAgent:
         """Cluster claims by themes, methods, and research objectives."""
         
         # Create paper lookup
-        paper_lookup = {getattr(p, 'id', f"paper_{hash(p.title)}"): p for p in papers}
+        paper_lookup = {p.id: p for p in papers}
         
         # Group claims by similarity
         clusters = []
         processed_claims = set()
         
         for i, claim in enumerate(claims):
-            claim_id = getattr(claim, 'id', claim.id)
+            claim_id = claim.id
             if claim_id in processed_claims:
                 continue
             
             # Find similar claims
             similar_claims = [claim]
-            similar_papers = [paper_lookup.get(getattr(claim, 'paper_id', claim.paper_id))]
+            similar_papers = [paper_lookup.get(claim.paper_id)]
             
             for j, other_claim in enumerate(claims[i+1:], i+1):
-                other_claim_id = getattr(other_claim, 'id', other_claim.id)
+                other_claim_id = other_claim.id
                 if other_claim_id in processed_claims:
                     continue
                 
                 # Check similarity based on keywords, methods, datasets
                 if self._are_claims_similar(claim, other_claim):
                     similar_claims.append(other_claim)
-                    similar_papers.append(paper_lookup.get(getattr(other_claim, 'paper_id', other_claim.paper_id)))
+                    similar_papers.append(paper_lookup.get(other_claim.paper_id))
                     processed_claims.add(other_claim_id)
             
             processed_claims.add(claim_id)
@@ -251,7 +447,7 @@ class LiteratureBuilderAgent:
         
         for paper in papers:
             if paper and hasattr(paper, 'title'):
-                paper_id = getattr(paper, 'id', f"paper_{hash(paper.title)}")
+                paper_id = paper.id
                 if paper_id in classified_papers:
                     q_ranking[paper_id] = classified_papers[paper_id]['q_rank']
                     if classified_papers[paper_id]['is_sa']:
@@ -316,7 +512,7 @@ class LiteratureBuilderAgent:
     def _find_cluster_contradictions(self, claims: List[Claim], contradictions: List[Any]) -> List[str]:
         """Find contradictions within the cluster."""
         cluster_contradictions = []
-        claim_ids = {getattr(claim, 'id', claim.id) for claim in claims}
+        claim_ids = {claim.id for claim in claims}
         
         for contradiction in contradictions:
             if hasattr(contradiction, 'claim1_id') and hasattr(contradiction, 'claim2_id'):
@@ -532,7 +728,7 @@ and identifying trends in the evolution of research approaches over time.
         
         # Sort papers by Q-ranking and year (Q1 first, then by year descending)
         def sort_key(paper):
-            paper_id = getattr(paper, 'id', f"paper_{hash(paper.title)}")
+            paper_id = paper.id
             q_rank = cluster.q_ranking.get(paper_id, 'Q3')
             q_priority = {'Q1': 1, 'Q2': 2, 'Q3': 3}.get(q_rank, 3)
             return (q_priority, -(paper.year if paper.year else 0))
@@ -545,7 +741,7 @@ and identifying trends in the evolution of research approaches over time.
         abstracts_data = []
         
         for paper in sorted_papers:
-            paper_id = getattr(paper, 'id', f"paper_{hash(paper.title)}")
+            paper_id = paper.id
             q_rank = cluster.q_ranking.get(paper_id, 'Q3')
             is_sa = paper_id in cluster.sa_papers
             
@@ -662,11 +858,10 @@ and identifying trends in the evolution of research approaches over time.
         full_paragraph = "".join(content_parts)
         
         # Clean up any double spaces or formatting issues
-        import re
-        full_paragraph = re.sub(r'\s+', ' ', full_paragraph)
+        full_paragraph = _WS_RE.sub(' ', full_paragraph)
         full_paragraph = full_paragraph.strip()
         
-        claim_ids = [getattr(claim, 'id', claim.id) for claim in cluster.claims]
+        claim_ids = [claim.id for claim in cluster.claims]
         
         return full_paragraph, citations, claim_ids
     
@@ -699,70 +894,50 @@ and identifying trends in the evolution of research approaches over time.
     def _process_abstract_for_literature(self, abstract, bibitem_key):
         """Process abstract to create literature content with LaTeX citations."""
         
-        # Clean abstract
-        abstract = abstract.strip()
-        if not abstract:
-            self.logger.warning("Empty abstract provided")
+        # Clean abstract; nothing useful can be built from an empty or very short one
+        abstract = abstract.strip() if abstract else ""
+        if len(abstract) < _MIN_ABSTRACT_CHARS:
+            self.logger.warning("Empty or too short abstract provided")
             return ""
         
-        self.logger.info(f"Processing abstract of {len(abstract)} characters for {bibitem_key}")
+        # Avoid formatting log messages at all when INFO is disabled
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        if log_info:
+            self.logger.info(f"Processing abstract of {len(abstract)} characters for {bibitem_key}")
         
         # Remove common abstract prefixes and suffixes
-        prefixes_to_remove = [
-            "Abstract:", "ABSTRACT:", "Summary:", "SUMMARY:",
-            "Background:", "BACKGROUND:", "Objective:", "OBJECTIVE:",
-            "Purpose:", "PURPOSE:", "Introduction:", "INTRODUCTION:",
-            "Methods:", "METHODS:", "Results:", "RESULTS:",
-            "Conclusion:", "CONCLUSION:", "Conclusions:", "CONCLUSIONS:"
-        ]
-        
         original_abstract = abstract
-        for prefix in prefixes_to_remove:
-            if abstract.startswith(prefix):
-                abstract = abstract[len(prefix):].strip()
+        while abstract.startswith(_ABSTRACT_PREFIXES):
+            prefix = next(p for p in _ABSTRACT_PREFIXES if abstract.startswith(p))
+            abstract = abstract[len(prefix):].strip()
+            if log_info:
                 self.logger.info(f"Removed prefix '{prefix}'")
         
-        # Remove common suffixes and metadata
-        suffixes_to_remove = [
-            "© 2023", "© 2024", "© 2025", "All rights reserved",
-            "Keywords:", "KEYWORDS:", "Key words:", "KEY WORDS:",
-            "Funding:", "FUNDING:", "Acknowledgments:", "ACKNOWLEDGMENTS:",
-            "Conflict of interest:", "CONFLICT OF INTEREST:",
-            "Author contributions:", "AUTHOR CONTRIBUTIONS:"
-        ]
-        
-        for suffix in suffixes_to_remove:
-            if suffix in abstract:
-                abstract = abstract.split(suffix)[0].strip()
-                self.logger.info(f"Removed suffix '{suffix}'")
+        # Remove common suffixes and metadata (cut at the earliest one found)
+        suffix_match = _ABSTRACT_SUFFIX_RE.search(abstract)
+        if suffix_match:
+            abstract = abstract[:suffix_match.start()].strip()
+            if log_info:
+                self.logger.info(f"Removed suffix '{suffix_match.group(0)}'")
         
-        # Split into sentences and clean them
-        import re
-        sentences = re.split(r'[.!?]+', abstract)
+        # Stream sentences and clean them, stopping once we have enough to select from
         clean_sentences = []
+        scanned = 0
         
-        self.logger.info(f"Found {len(sentences)} sentences in abstract")
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
+        for match in _SENT_RE.finditer(abstract):
+            if len(clean_sentences) >= _MAX_CLEAN_SENTENCES:
+                break
+            scanned += 1
+            sentence = match.group(0).strip()
             if len(sentence) > 15:  # Only meaningful sentences
                 # Remove common research paper phrases that don't add value to literature
-                skip_phrases = [
-                    "in this paper", "in this study", "in this work", "we present",
-                    "we propose", "we show", "we demonstrate", "our results",
-                    "our findings", "our approach", "our method", "this paper",
-                    "this study", "this work", "the present study"
-                ]
-                
-                sentence_lower = sentence.lower()
-                should_skip = any(phrase in sentence_lower for phrase in skip_phrases)
-                
-                if not should_skip:
+                if not _SKIP_RE.search(sentence):
                     clean_sentences.append(sentence)
-                else:
+                elif log_info:
                     self.logger.info(f"Skipped sentence with research phrase: {sentence[:50]}...")
         
-        self.logger.info(f"Kept {len(clean_sentences)} clean sentences")
+        if log_info:
+            self.logger.info(f"Kept {len(clean_sentences)} clean sentences of {scanned} scanned")
         
         if not clean_sentences:
             self.logger.warning("No clean sentences found after filtering")
@@ -777,7 +952,8 @@ and identifying trends in the evolution of research approaches over time.
         else:
             selected_sentences = clean_sentences       # Use all if only one
         
-        self.logger.info(f"Selected {len(selected_sentences)} sentences for literature")
+        if log_info:
+            self.logger.info(f"Selected {len(selected_sentences)} sentences for literature")
         
         # Process sentences to create academic literature content
         processed_sentences = []
@@ -790,8 +966,8 @@ and identifying trends in the evolution of research approaches over time.
             sentence = sentence.strip()
             
             # Convert first-person to third-person for academic tone
-            sentence = re.sub(r'\bwe\b', 'the authors', sentence, flags=re.IGNORECASE)
-            sentence = re.sub(r'\bour\b', 'their', sentence, flags=re.IGNORECASE)
+            sentence = _WE_RE.sub('the authors', sentence)
+            sentence = _OUR_RE.sub('their', sentence)
             
             # Ensure sentence ends with period
             if not sentence.endswith('.'):
@@ -814,7 +990,8 @@ and identifying trends in the evolution of research approaches over time.
         
         literature_text += " "
         
-        self.logger.info(f"Generated literature text of {len(literature_text)} characters")
+        if log_info:
+            self.logger.info(f"Generated literature text of {len(literature_text)} characters")
         
         return literature_text
     
@@ -831,23 +1008,21 @@ and identifying trends in the evolution of research approaches over time.
         all_citations = []
         all_claim_ids = []
         
-        # Analyze contradictions
-        if any(c.contradictions for c in relevant_clusters):
-            contradiction_content = "### Contradictory Findings\n\n"
-            for cluster in relevant_clusters:
-                if cluster.contradictions:
-                    contradiction_content += f"In {cluster.theme.lower()} research, {cluster.contradictions[0]} "
-                    contradiction_content += f"This highlights the need for further investigation in this area.\n\n"
-            content_parts.append(contradiction_content)
-        
-        # Analyze agreements
-        if any(c.agreements for c in relevant_clusters):
-            agreement_content = "### Consistent Findings\n\n"
-            for cluster in relevant_clusters:
-                if cluster.agreements:
-                    agreement_content += f"There is consensus in {cluster.theme.lower()} research regarding "
-                    agreement_content += f"{cluster.agreements[0]}\n\n"
-            content_parts.append(agreement_content)
+        # Analyze contradictions and agreements in a single pass over the clusters
+        contradiction_parts = []
+        agreement_parts = []
+        for cluster in relevant_clusters:
+            if cluster.contradictions:
+                contradiction_parts.append(f"In {cluster.theme.lower()} research, {cluster.contradictions[0]} ")
+                contradiction_parts.append("This highlights the need for further investigation in this area.\n\n")
+            if cluster.agreements:
+                agreement_parts.append(f"There is consensus in {cluster.theme.lower()} research regarding ")
+                agreement_parts.append(f"{cluster.agreements[0]}\n\n")
+        
+        if contradiction_parts:
+            content_parts.append("### Contradictory Findings\n\n" + "".join(contradiction_parts))
+        if agreement_parts:
+            content_parts.append("### Consistent Findings\n\n" + "".join(agreement_parts))
         
         # Q-ranking analysis
         q_analysis = self._analyze_q_rankings(relevant_clusters)
@@ -867,10 +1042,17 @@ and identifying trends in the evolution of research approaches over time.
     def _analyze_q_rankings(self, clusters: List[ClaimCluster]) -> str:
         """Analyze the distribution of Q-rankings across clusters."""
         
-        total_q1 = sum(len([p for p in c.q_ranking.values() if p == 'Q1']) for c in clusters)
-        total_q2 = sum(len([p for p in c.q_ranking.values() if p == 'Q2']) for c in clusters)
-        total_q3 = sum(len([p for p in c.q_ranking.values() if p == 'Q3']) for c in clusters)
-        total_sa = sum(len(c.sa_papers) for c in clusters)
+        # Single pass over every cluster's rankings
+        total_q1 = total_q2 = total_q3 = total_sa = 0
+        for c in clusters:
+            for rank in c.q_ranking.values():
+                if rank == 'Q1':
+                    total_q1 += 1
+                elif rank == 'Q2':
+                    total_q2 += 1
+                elif rank == 'Q3':
+                    total_q3 += 1
+            total_sa += len(c.sa_papers)
         
         total_papers = total_q1 + total_q2 + total_q3
         
@@ -893,12 +1075,23 @@ overviews of their respective domains.
     ) -> LiteratureSection:
         """Build the trends and evolution section."""
         
-        # Analyze temporal trends
-        year_themes = defaultdict(list)
+        # Analyze temporal trends: only the earliest/latest years and their themes are needed
+        first_year = last_year = None
+        early_themes = set()
+        recent_themes = set()
         for cluster in clusters:
             for paper in cluster.papers:
-                if paper.year:
-                    year_themes[paper.year].append(cluster.theme)
+                year = paper.year
+                if not year:
+                    continue
+                if first_year is None or year < first_year:
+                    first_year, early_themes = year, {cluster.theme}
+                elif year == first_year:
+                    early_themes.add(cluster.theme)
+                if last_year is None or year > last_year:
+                    last_year, recent_themes = year, {cluster.theme}
+                elif year == last_year:
+                    recent_themes.add(cluster.theme)
         
         # Analyze methodological evolution
         method_evolution = defaultdict(list)
@@ -912,28 +1105,24 @@ overviews of their respective domains.
         content_parts = []
         
         # Temporal trends
-        if year_themes:
-            sorted_years = sorted(year_themes.keys())
-            early_themes = set(year_themes[sorted_years[0]]) if sorted_years else set()
-            recent_themes = set(year_themes[sorted_years[-1]]) if sorted_years else set()
-            
+        if first_year is not None:
             temporal_content = f"""
 ### Temporal Evolution
 
-The research landscape has evolved significantly over the analyzed period. Early work (around {sorted_years[0] if sorted_years else 'N/A'}) 
+The research landscape has evolved significantly over the analyzed period. Early work (around {first_year}) 
 focused primarily on {', '.join(list(early_themes)[:3]) if early_themes else 'foundational approaches'}. 
-Recent developments (around {sorted_years[-1] if sorted_years else 'N/A'}) have shifted towards 
+Recent developments (around {last_year}) have shifted towards 
 {', '.join(list(recent_themes)[:3]) if recent_themes else 'advanced methodologies'}.
             """.strip()
             content_parts.append(temporal_content)
         
         # Methodological trends
         if method_evolution:
-            method_content = "### Methodological Trends\n\n"
+            method_parts = ["### Methodological Trends\n\n"]
             for method, years in method_evolution.items():
                 avg_year = sum(years) / len(years)
-                method_content += f"{method.title()} approaches have been predominantly explored around {avg_year:.0f}. "
-            content_parts.append(method_content)
+                method_parts.append(f"{method.title()} approaches have been predominantly explored around {avg_year:.0f}. ")
+            content_parts.append("".join(method_parts))
         
         content = "\n\n".join(content_parts) if content_parts else "Temporal and methodological trends analysis requires more diverse temporal data."
         
@@ -945,12 +1134,33 @@ Recent developments (around {sorted_years[-1] if sorted_years else 'N/A'}) have
             claim_ids=[]
         )
     
-    def _generate_bibliography(self, papers: List[PaperMetadata]) -> List[str]:
+    async def _generate_bibliography(self, papers: List[PaperMetadata]) -> List[str]:
         """Generate bibliography entries with correct custom format and accurate data."""
         
         bibliography = []
         
-        for paper in sorted(papers, key=lambda p: (p.authors[0] if p.authors else 'Unknown', p.year)):
+        # Resolve volume/issue/pages for every DOI up-front: cached DOIs first,
+        # the rest in batched CrossRef requests. SQLite access runs in the
+        # default executor so the event loop is never blocked on disk
+        loop = asyncio.get_running_loop()
+        dois = list(dict.fromkeys(_normalize_doi(p.doi) for p in papers if p.doi))
+        crossref_data = {}
+        if self._doi_cache and dois:
+            crossref_data = await loop.run_in_executor(None, self._cached_crossref_data, dois)
+        uncached_dois = [doi for doi in dois if doi not in crossref_data]
+        
+        fetched = await self._fetch_crossref_dois(uncached_dois)
+        
+        # Cache hits and definitive misses (empty dicts); transient failures are not cached
+        if self._doi_cache and fetched:
+            await loop.run_in_executor(None, self._doi_cache.set_many, fetched)
+        crossref_data.update(fetched)
+        
+        # Sort by (first author, year) with precomputed keys; a missing year sorts as 0
+        decorated = [((p.authors[0] if p.authors else 'Unknown'), p.year or 0, p) for p in papers]
+        decorated.sort(key=itemgetter(0, 1))
+        
+        for _, _, paper in decorated:
             # Generate bibitem key
             bibitem_key = self._generate_bibitem_key(paper)
             
@@ -965,34 +1175,32 @@ Recent developments (around {sorted_years[-1] if sorted_years else 'N/A'}) have
             year = paper.year or 'Unknown Year'
             
             # Extract volume, issue, pages from DOI or other sources if available
-            volume_info = self._extract_volume_info(paper)
+            volume_info = self._extract_volume_info(paper, crossref_data)
             
             # Build custom citation format: \bibitem{KaPa23} F.M. Last, Title, Journal \textbf{vol}(issue) (year) pages. DOI
-            entry = f"\\bibitem{{{bibitem_key}}} {formatted_authors}, {formatted_title}, {venue}"
+            parts = [f"\\bibitem{{{bibitem_key}}} {formatted_authors}, {formatted_title}, {venue}"]
             
             # Add volume and issue information ONLY if we have real data
             if volume_info['volume']:
-                entry += f" \\textbf{{{volume_info['volume']}}}"
+                parts.append(f" \\textbf{{{volume_info['volume']}}}")
                 if volume_info['issue']:
-                    entry += f"({volume_info['issue']})"
+                    parts.append(f"({volume_info['issue']})")
             
             # Add year
-            entry += f" ({year})"
+            parts.append(f" ({year})")
             
             # Add pages ONLY if we have real data
             if volume_info['pages']:
-                entry += f" {volume_info['pages']}"
+                parts.append(f" {volume_info['pages']}")
             
-            # Add DOI
+            # Add DOI (as a resolver link unless already a URL), else the paper URL
             if paper.doi:
-                if paper.doi.startswith('http'):
-                    entry += f". {paper.doi}"
-                else:
-                    entry += f". https://doi.org/{paper.doi}"
+                doi_link = paper.doi if paper.doi.startswith('http') else f"https://doi.org/{paper.doi}"
+                parts.append(f". {doi_link}")
             elif paper.url:
-                entry += f". {paper.url}"
+                parts.append(f". {paper.url}")
             
-            bibliography.append(entry)
+            bibliography.append("".join(parts))
         
         return bibliography
     
@@ -1001,45 +1209,7 @@ Recent developments (around {sorted_years[-1] if sorted_years else 'N/A'}) have
         if not authors:
             return "Unknown Author"
         
-        formatted_authors = []
-        
-        for author in authors:
-            author = author.strip()
-            parts = author.split()
-            
-            if len(parts) < 2:
-                formatted_authors.append(author)
-                continue
-            
-            # Check if author is already in correct format (e.g., "Y. Saad", "M.H. Schultz")
-            if len(parts) == 2 and len(parts[0]) <= 4 and '.' in parts[0]:
-                # Already in format like "Y. Saad" or "M.H. Schultz"
-                formatted_authors.append(author)
-                continue
-                
-            # Last part is last name
-            last_name = parts[-1]
-            
-            # Everything else is first/middle names
-            first_middle = parts[:-1]
-            
-            # Create initials
-            initials = []
-            for name in first_middle:
-                if name and name[0].isalpha():
-                    # Handle names that might already have periods
-                    if name.endswith('.'):
-                        initials.append(name)
-                    else:
-                        initials.append(f"{name[0].upper()}.")
-            
-            # Format as "F.M. Last" (initials first, then last name)
-            if initials:
-                formatted_authors.append(f"{''.join(initials)} {last_name}")
-            else:
-                formatted_authors.append(last_name)
-        
-        return ", ".join(formatted_authors)
+        return ", ".join([_format_author(author) for author in authors])
     
     def _format_title_custom(self, title):
         """Format title with only first letter capital, except proper nouns."""
@@ -1061,20 +1231,10 @@ Recent developments (around {sorted_years[-1] if sorted_years else 'N/A'}) have
             title_formatted = title_lower
         
         # Capitalize proper nouns
-        proper_nouns = ["wiener", "euler", "hamilton", "fibonacci", "pascal", "newton", "gauss",
-                       "fourier", "laplace", "bayes", "markov", "poisson", "bernoulli",
-                       "covid", "sars", "hiv", "aids", "dna", "rna", "pcr", "crispr"]
-        
-        for proper_noun in proper_nouns:
-            import re
-            pattern = r'\b' + re.escape(proper_noun.lower()) + r'\b'
-            replacement = proper_noun.capitalize()
-            title_formatted = re.sub(pattern, replacement, title_formatted, flags=re.IGNORECASE)
-        
-        return title_formatted
+        return _PROPER_NOUNS_RE.sub(lambda m: _PROPER_NOUNS[m.group(0).lower()], title_formatted)
     
-    def _extract_volume_info(self, paper):
-        """Extract volume, issue, and page information from paper metadata or DOI."""
+    def _parse_crossref_work(self, work: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """Extract volume, issue and pages from a CrossRef work record."""
         volume_info = {
             'volume': None,
             'issue': None,
@@ -1082,106 +1242,291 @@ Recent developments (around {sorted_years[-1] if sorted_years else 'N/A'}) have
             'article_number': None
         }
         
-    def _extract_volume_info(self, paper):
-        """Extract volume, issue, and page information from paper metadata or DOI."""
-        volume_info = {
-            'volume': None,
-            'issue': None,
-            'pages': None,
-            'article_number': None
-        }
+        # Extract volume
+        if 'volume' in work and work['volume']:
+            volume_info['volume'] = str(work['volume']).strip()
+        
+        # Extract issue
+        if 'issue' in work and work['issue']:
+            volume_info['issue'] = str(work['issue']).strip()
+        
+        # Extract pages - handle different formats
+        if 'page' in work and work['page']:
+            pages = str(work['page']).strip()
+            # Handle different page formats: "123-145", "123--145", "e123456", etc.
+            if pages:
+                volume_info['pages'] = pages
+        elif 'article-number' in work and work['article-number']:
+            article_num = str(work['article-number']).strip()
+            volume_info['article_number'] = article_num
+            volume_info['pages'] = article_num  # Use article number as pages
         
-        # Try to extract from DOI using CrossRef API
-        if paper.doi and requests:
+        return volume_info
+    
+    def _get_crossref_session(self):
+        """Return the shared keep-alive requests session for CrossRef, creating it on first use."""
+        if self._crossref_session is None:
+            session = requests.Session()
+            session.headers.update(_CROSSREF_HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=_CROSSREF_CONCURRENCY,
+                pool_maxsize=_CROSSREF_CONCURRENCY,
+                max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(429, 502, 503, 504))
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._crossref_session = session
+        return self._crossref_session
+    
+    def _fetch_crossref_batch(self, dois: List[str]) -> Tuple[Dict[str, Dict[str, Optional[str]]], List[str]]:
+        """
+        Resolve many DOIs with CrossRef's filter=doi: query instead of one GET per paper.
+        
+        Args:
+            dois: Raw DOIs as stored on the papers
+            
+        Returns:
+            Tuple of (dict mapping normalized DOI -> volume info, list of normalized
+            DOIs whose batch request failed). DOIs not found in CrossRef map to {}.
+        """
+        results = {}
+        failed = []
+        clean_dois = list(dict.fromkeys(_normalize_doi(doi) for doi in dois))
+        if not clean_dois:
+            return results, failed
+        if not requests:
+            # Leave every DOI to the per-DOI path
+            return results, clean_dois
+        
+        for start in range(0, len(clean_dois), _CROSSREF_BATCH_SIZE):
+            chunk = clean_dois[start:start + _CROSSREF_BATCH_SIZE]
+            params = {
+                'filter': ','.join(f"doi:{doi}" for doi in chunk),
+                'rows': len(chunk)
+            }
+            
             try:
-                import time
-                
-                # Clean DOI - handle various DOI formats
-                doi = paper.doi.strip()
-                if doi.startswith('https://doi.org/'):
-                    doi = doi.replace('https://doi.org/', '')
-                elif doi.startswith('http://dx.doi.org/'):
-                    doi = doi.replace('http://dx.doi.org/', '')
-                elif doi.startswith('doi:'):
-                    doi = doi.replace('doi:', '')
-                
-                # Query CrossRef API for accurate bibliographic data
-                crossref_url = f"https://api.crossref.org/works/{doi}"
-                headers = {
-                    'User-Agent': 'Research System/1.0 (mailto:research@example.com)',
-                    'Accept': 'application/json'
-                }
-                
-                self.logger.info(f"Fetching bibliographic data for DOI: {doi}")
-                response = requests.get(crossref_url, headers=headers, timeout=10)  # Reduced timeout
+                self.logger.info(f"Fetching bibliographic data for {len(chunk)} DOIs from CrossRef")
+                response = self._get_crossref_session().get(_CROSSREF_WORKS_URL, params=params, timeout=20)
                 
                 if response.status_code == 200:
-                    data = response.json()
-                    work = data.get('message', {})
-                    
-                    # Extract volume
-                    if 'volume' in work and work['volume']:
-                        volume_info['volume'] = str(work['volume']).strip()
-                    
-                    # Extract issue
-                    if 'issue' in work and work['issue']:
-                        volume_info['issue'] = str(work['issue']).strip()
-                    
-                    # Extract pages - handle different formats
-                    if 'page' in work and work['page']:
-                        pages = str(work['page']).strip()
-                        # Handle different page formats: "123-145", "123--145", "e123456", etc.
-                        if pages:
-                            volume_info['pages'] = pages
-                    elif 'article-number' in work and work['article-number']:
-                        article_num = str(work['article-number']).strip()
-                        volume_info['article_number'] = article_num
-                        volume_info['pages'] = article_num  # Use article number as pages
-                    
-                    # Log successful extraction
-                    self.logger.info(f"Successfully extracted: vol={volume_info['volume']}, issue={volume_info['issue']}, pages={volume_info['pages']}")
+                    items = response.json().get('message', {}).get('items', [])
+                    for work in items:
+                        if work.get('DOI'):
+                            results[_normalize_doi(work['DOI'])] = self._parse_crossref_work(work)
                     
-                    # Small delay to be respectful to CrossRef API
-                    time.sleep(0.1)
-                    
-                elif response.status_code == 404:
-                    self.logger.info(f"DOI {doi} not found in CrossRef (404) - this is normal for test/fake DOIs")
+                    # DOIs absent from a successful response are not in CrossRef
+                    for doi in chunk:
+                        results.setdefault(doi, {})
                 else:
-                    self.logger.warning(f"CrossRef API returned status {response.status_code} for DOI {doi}")
+                    self.logger.warning(f"CrossRef API returned status {response.status_code} for DOI batch")
+                    failed.extend(chunk)
                     
             except requests.exceptions.Timeout:
-                self.logger.warning(f"Timeout while fetching bibliographic data for DOI {paper.doi} - continuing without volume info")
+                self.logger.warning("Timeout while fetching bibliographic data for DOI batch - continuing without volume info")
+                failed.extend(chunk)
             except requests.exceptions.RequestException as e:
-                self.logger.warning(f"Request error while fetching bibliographic data for DOI {paper.doi}: {str(e)}")
+                self.logger.warning(f"Request error while fetching bibliographic data for DOI batch: {str(e)}")
+                failed.extend(chunk)
             except Exception as e:
-                self.logger.warning(f"Unexpected error while fetching bibliographic data for DOI {paper.doi}: {str(e)}")
-        elif paper.doi and not requests:
+                self.logger.warning(f"Unexpected error while fetching bibliographic data for DOI batch: {str(e)}")
+                failed.extend(chunk)
+        
+        self.logger.info(f"CrossRef resolved {sum(1 for info in results.values() if info)}/{len(clean_dois)} DOIs")
+        return results, failed
+    
+    def _cached_crossref_data(self, dois: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+        """Volume info from the DOI cache for those of the DOIs it holds (blocking)."""
+        cached = {}
+        for doi in dois:
+            info = self._doi_cache.get(doi)
+            if info is not None:
+                cached[doi] = info
+        return cached
+    
+    def _fetch_crossref_dois_blocking(self, dois: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+        """Blocking counterpart of _fetch_crossref_dois, used when aiohttp is not installed."""
+        fetched, failed = self._fetch_crossref_batch(dois)
+        for doi in failed:
+            info = self._fetch_crossref_work(doi)
+            if info is not None:
+                fetched[doi] = info
+        return fetched
+    
+    def _fetch_crossref_work(self, doi: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Query CrossRef for a single normalized DOI (blocking).
+        
+        Returns {} if CrossRef does not know the DOI, None if the lookup failed.
+        """
+        if not requests:
             self.logger.warning("Requests library not available, skipping CrossRef API call")
+            return None
         
-        # Only use fallback values if we couldn't get any real data
-        # This ensures we don't override real data with fake data
-        if not any([volume_info['volume'], volume_info['issue'], volume_info['pages']]):
-            # Try to extract from venue name if it contains volume/issue info
-            if paper.venue:
-                venue_lower = paper.venue.lower()
-                import re
-                
-                # Look for patterns like "vol. 25, no. 3" or "25(3)" in venue
-                vol_match = re.search(r'vol(?:ume)?\.?\s*(\d+)', venue_lower)
-                if vol_match:
-                    volume_info['volume'] = vol_match.group(1)
-                
-                issue_match = re.search(r'(?:no|issue)\.?\s*(\d+)', venue_lower)
-                if issue_match:
-                    volume_info['issue'] = issue_match.group(1)
+        try:
+            # Query CrossRef API for accurate bibliographic data
+            self.logger.info(f"Fetching bibliographic data for DOI: {doi}")
+            response = self._get_crossref_session().get(f"{_CROSSREF_WORKS_URL}/{doi}", timeout=10)
+            
+            if response.status_code == 200:
+                return self._parse_crossref_work(response.json().get('message', {}))
+            elif response.status_code == 404:
+                self.logger.info(f"DOI {doi} not found in CrossRef (404) - this is normal for test/fake DOIs")
+                return {}
+            else:
+                self.logger.warning(f"CrossRef API returned status {response.status_code} for DOI {doi}")
                 
-                # Look for pattern like "25(3)" 
-                vol_issue_match = re.search(r'(\d+)\((\d+)\)', venue_lower)
-                if vol_issue_match:
-                    volume_info['volume'] = vol_issue_match.group(1)
-                    volume_info['issue'] = vol_issue_match.group(2)
+        except requests.exceptions.Timeout:
+            self.logger.warning(f"Timeout while fetching bibliographic data for DOI {doi} - continuing without volume info")
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"Request error while fetching bibliographic data for DOI {doi}: {str(e)}")
+        except Exception as e:
+            self.logger.warning(f"Unexpected error while fetching bibliographic data for DOI {doi}: {str(e)}")
         
-        return volume_info
+        return None
+    
+    async def _fetch_crossref_work_async(
+        self,
+        session: Any,
+        semaphore: asyncio.Semaphore,
+        doi: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """Async counterpart of _fetch_crossref_work: {} if not found, None on failure."""
+        async with semaphore:
+            try:
+                self.logger.info(f"Fetching bibliographic data for DOI: {doi}")
+                async with session.get(f"{_CROSSREF_WORKS_URL}/{doi}") as response:
+                    if response.status == 200:
+                        data = await response.json(content_type=None)
+                        return self._parse_crossref_work(data.get('message', {}))
+                    elif response.status == 404:
+                        self.logger.info(f"DOI {doi} not found in CrossRef (404) - this is normal for test/fake DOIs")
+                        return {}
+                    else:
+                        self.logger.warning(f"CrossRef API returned status {response.status} for DOI {doi}")
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Timeout while fetching bibliographic data for DOI {doi} - continuing without volume info")
+            except Exception as e:
+                self.logger.warning(f"Error while fetching bibliographic data for DOI {doi}: {str(e)}")
+        
+        return None
+    
+    async def _fetch_crossref_batch_async(
+        self,
+        session: Any,
+        dois: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Optional[str]]], List[str]]:
+        """Async counterpart of _fetch_crossref_batch for normalized DOIs, sharing an aiohttp session."""
+        results = {}
+        failed = []
+        timeout = aiohttp.ClientTimeout(total=20)
+        
+        for start in range(0, len(dois), _CROSSREF_BATCH_SIZE):
+            chunk = dois[start:start + _CROSSREF_BATCH_SIZE]
+            params = {
+                'filter': ','.join(f"doi:{doi}" for doi in chunk),
+                'rows': str(len(chunk))
+            }
+            
+            try:
+                self.logger.info(f"Fetching bibliographic data for {len(chunk)} DOIs from CrossRef")
+                async with session.get(_CROSSREF_WORKS_URL, params=params, timeout=timeout) as response:
+                    if response.status == 200:
+                        data = await response.json(content_type=None)
+                        for work in data.get('message', {}).get('items', []):
+                            if work.get('DOI'):
+                                results[_normalize_doi(work['DOI'])] = self._parse_crossref_work(work)
+                        
+                        # DOIs absent from a successful response are not in CrossRef
+                        for doi in chunk:
+                            results.setdefault(doi, {})
+                    else:
+                        self.logger.warning(f"CrossRef API returned status {response.status} for DOI batch")
+                        failed.extend(chunk)
+                        
+            except asyncio.TimeoutError:
+                self.logger.warning("Timeout while fetching bibliographic data for DOI batch - continuing without volume info")
+                failed.extend(chunk)
+            except Exception as e:
+                self.logger.warning(f"Error while fetching bibliographic data for DOI batch: {str(e)}")
+                failed.extend(chunk)
+        
+        self.logger.info(f"CrossRef resolved {sum(1 for info in results.values() if info)}/{len(dois)} DOIs")
+        return results, failed
+    
+    def _open_crossref_session(self) -> Any:
+        """Create an aiohttp session for CrossRef, capped at _CROSSREF_CONCURRENCY connections."""
+        connector = aiohttp.TCPConnector(limit=_CROSSREF_CONCURRENCY)
+        timeout = aiohttp.ClientTimeout(total=10)
+        return aiohttp.ClientSession(headers=_CROSSREF_HEADERS, connector=connector, timeout=timeout)
+    
+    async def _fetch_crossref_dois(self, dois: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        Resolve normalized DOIs with batched filter=doi: requests, retrying the DOIs
+        of failed batches individually and concurrently.
+        
+        Returns a dict mapping DOI -> volume info ({} if CrossRef does not know the
+        DOI); DOIs whose lookups failed are left out. Without aiohttp the blocking
+        requests path runs in the default executor, off the event loop.
+        """
+        if not dois:
+            return {}
+        
+        if not aiohttp:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._fetch_crossref_dois_blocking, dois)
+        
+        async with self._open_crossref_session() as session:
+            fetched, failed_dois = await self._fetch_crossref_batch_async(session, dois)
+            if failed_dois:
+                fetched.update(await self._fetch_crossref_concurrent(session, failed_dois))
+        return fetched
+    
+    async def _fetch_crossref_concurrent(
+        self,
+        session: Any,
+        dois: List[str]
+    ) -> Dict[str, Dict[str, Optional[str]]]:
+        """Resolve normalized DOIs one request each over the aiohttp session, overlapping the requests."""
+        semaphore = asyncio.Semaphore(_CROSSREF_CONCURRENCY)
+        infos = await asyncio.gather(
+            *[self._fetch_crossref_work_async(session, semaphore, doi) for doi in dois]
+        )
+        return {doi: info for doi, info in zip(dois, infos) if info is not None}
+    
+    def _extract_volume_info(self, paper, crossref_data: Optional[Dict[str, Dict[str, Optional[str]]]] = None):
+        """
+        Extract volume, issue, and page information from paper metadata or DOI.
+        
+        If crossref_data (prefetched by _generate_bibliography) is given, it is used
+        instead of querying CrossRef for this paper.
+        """
+        volume_info = {
+            'volume': None,
+            'issue': None,
+            'pages': None,
+            'article_number': None
+        }
+        
+        # Use prefetched CrossRef data when available
+        if paper.doi and crossref_data is not None:
+            prefetched = crossref_data.get(_normalize_doi(paper.doi))
+            if prefetched:
+                volume_info.update(prefetched)
+        
+        # Try to extract from DOI using the persistent cache, then the CrossRef API
+        elif paper.doi:
+            doi = _normalize_doi(paper.doi)
+            fetched = self._doi_cache.get(doi) if self._doi_cache else None
+            if fetched is None:
+                fetched = self._fetch_crossref_work(doi)
+                if fetched is not None and self._doi_cache:
+                    self._doi_cache.set(doi, fetched)
+            if fetched:
+                volume_info.update(fetched)
+                
+                # Log successful extraction
+                self.logger.info(f"Successfully extracted: vol={volume_info['volume']}, issue={volume_info['issue']}, pages={volume_info['pages']}")
         
         # Only use fallback values if we couldn't get any real data
         # This ensures we don't override real data with fake data
@@ -1189,19 +1534,18 @@ Recent developments (around {sorted_years[-1] if sorted_years else 'N/A'}) have
             # Try to extract from venue name if it contains volume/issue info
             if paper.venue:
                 venue_lower = paper.venue.lower()
-                import re
                 
                 # Look for patterns like "vol. 25, no. 3" or "25(3)" in venue
-                vol_match = re.search(r'vol(?:ume)?\.?\s*(\d+)', venue_lower)
+                vol_match = _VOLUME_RE.search(venue_lower)
                 if vol_match:
                     volume_info['volume'] = vol_match.group(1)
                 
-                issue_match = re.search(r'(?:no|issue)\.?\s*(\d+)', venue_lower)
+                issue_match = _ISSUE_RE.search(venue_lower)
                 if issue_match:
                     volume_info['issue'] = issue_match.group(1)
                 
                 # Look for pattern like "25(3)" 
-                vol_issue_match = re.search(r'(\d+)\((\d+)\)', venue_lower)
+                vol_issue_match = _VOL_ISSUE_RE.search(venue_lower)
                 if vol_issue_match:
                     volume_info['volume'] = vol_issue_match.group(1)
                     volume_info['issue'] = vol_issue_match.group(2)
@@ -1211,8 +1555,9 @@ Recent developments (around {sorted_years[-1] if sorted_years else 'N/A'}) have
     def get_literature_stats(self, document: LiteratureDocument) -> Dict[str, Any]:
         """Get statistics about the generated literature."""
         
-        total_words = sum(len(section.content.split()) for section in document.sections)
-        total_citations = len(set(citation for section in document.sections for citation in section.citations))
+        # Sections count their words once at construction; reuse that instead of re-splitting
+        total_words = document.total_word_count
+        total_citations = document.total_citations
         
         return {
             'total_sections': len(document.sections),
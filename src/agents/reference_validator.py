@@ -10,28 +10,73 @@ This agent processes uploaded reference files to:
 
 import re
 import asyncio
+import hashlib
+import io
+import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple, Set
-from collections import defaultdict
+import sys
+import time
+from typing import List, Dict, Any, Optional, Tuple, Set, Iterator
+from collections import Counter, defaultdict, OrderedDict
+from functools import lru_cache
+from bisect import bisect_right
+from itertools import accumulate
 import difflib
 from datetime import datetime
 
 # Import requests with fallback
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     requests = None
 
+# Import aiohttp with fallback
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Faster JSON decoding of CrossRef responses when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# C++ string similarity when rapidfuzz is installed; difflib otherwise
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+# Optional Aho-Corasick automaton for single-pass journal name matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# JIT-compiled edit distance for the fallback path when numba is installed
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
 # Try relative imports first, then absolute
 try:
     from ..models.data_models import PaperMetadata
     from .base_agent import BaseAgent
+    from ..memory.doi_cache import DEFAULT_CACHE_DIR, DOICache
+    from ..utils.minhash import MinHashLSH, title_minhash
 except ImportError:
     # Fallback to absolute imports for testing
     import sys
     import os
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
     from models.data_models import PaperMetadata
+    from memory.doi_cache import DEFAULT_CACHE_DIR, DOICache
+    from utils.minhash import MinHashLSH, title_minhash
     
     # Create a simple base agent for testing
     class BaseAgent:
@@ -42,6 +87,568 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# CrossRef verification
+_CROSSREF_WORKS_URL = "https://api.crossref.org/works"
+_CROSSREF_HEADERS = {
+    'User-Agent': 'Research System/1.0 (mailto:research@example.com)',
+    'Accept': 'application/json'
+}
+_VERIFY_CONCURRENCY = 8
+# Requests per second shared by all verification tasks, under CrossRef's polite-pool limit
+_CROSSREF_RATE_LIMIT = 45
+# DOIs per filter=doi: request; bounded by URL length limits
+_CROSSREF_DOI_BATCH_SIZE = 50
+_CROSSREF_RESPONSE_CACHE_SIZE = 2048
+# On-disk CrossRef answers; lookups that came back 404 are retried sooner than hits
+_CROSSREF_DISK_CACHE_PATH = str(DEFAULT_CACHE_DIR / "crossref_responses.sqlite")
+_NEGATIVE_CACHE_TTL = 7 * 86400
+# The parts of a CrossRef work that verification uses; only these are kept and cached
+_CROSSREF_WORK_FIELDS = (
+    'DOI', 'title', 'author', 'container-title', 'published-print', 'published-online',
+    'volume', 'issue', 'page', 'article-number'
+)
+# Asks CrossRef to send only those fields from /works queries
+_CROSSREF_SELECT = ','.join(_CROSSREF_WORK_FIELDS)
+# verified_data entry -> reference field it replaces
+_VERIFIED_FIELD_MAP = (
+    ('verified_title', 'title'),
+    ('verified_authors', 'authors'),
+    ('verified_journal', 'journal'),
+    ('verified_year', 'year'),
+    ('verified_volume', 'volume'),
+    ('verified_issue', 'issue'),
+    ('verified_pages', 'pages'),
+    ('verified_doi', 'doi'),
+)
+# (CrossRef field, reference field, label) for the numbering fields checked as plain strings;
+# an article number is used only when CrossRef has no page range
+_CROSSREF_NUMBERING_FIELDS = (
+    ('volume', 'volume', 'Volume'),
+    ('issue', 'issue', 'Issue'),
+    ('page', 'pages', 'Pages'),
+    ('article-number', 'pages', 'Article number'),
+)
+# Per-reference verification lists shown in the validation report, with their headings
+_REPORT_VERIFICATION_LISTS = (
+    ('checks_performed', "   Checks Performed:"),
+    ('corrections_made', "   Data Corrections Made:"),
+    ('issues_found', "   Issues Found:"),
+)
+# Reference fields a CrossRef verification reads; references equal on all of them verify identically
+_VERIFIED_FIELDS = ('doi', 'title', 'authors', 'journal', 'year', 'volume', 'issue', 'pages')
+
+# Duplicate detection switches from (last name, year) blocking to title MinHash-LSH above this size
+_LSH_MIN_REFERENCES = 2000
+_LSH_THRESHOLD = 0.8
+_MINHASH_NUM_PERM = 64
+_SHINGLE_SIZE = 5
+
+# Reference fields written to BibTeX output, in order (the DOI is written separately)
+_BIBTEX_OUTPUT_FIELDS = (
+    ('authors', 'author'),
+    ('title', 'title'),
+    ('journal', 'journal'),
+    ('year', 'year'),
+    ('volume', 'volume'),
+    ('issue', 'number'),
+    ('pages', 'pages'),
+)
+
+# Reference file entries
+_BIBITEM_RE = re.compile(r'\\bibitem\{([^}]+)\}\s*(.+?)(?=\\bibitem|\Z)', re.DOTALL)
+_BIBTEX_ENTRY_RE = re.compile(r'@(\w+)\{([^,]+),\s*(.+?)\n\}', re.DOTALL)
+# BibTeX field tokens: `name =`, the braces/quotes that delimit values, bare values
+_FIELD_NAME_RE = re.compile(r'(\w+)\s*=\s*')
+_BRACE_RE = re.compile(r'[{}]')
+_QUOTE_OR_BRACE_RE = re.compile(r'["{}]')
+_BARE_VALUE_RE = re.compile(r'[^,\s}]+')
+
+# Components of a single reference
+_TRAILING_URL_RE = re.compile(r'(https?://[^\s]+)\.?\s*$')
+_URL_RE = re.compile(r'https?://[^\s]+')
+# Resolver URL or scheme in front of a DOI
+_DOI_PREFIX_RE = re.compile(r'(?:https?://(?:dx\.)?doi\.org/|doi:)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\((\d{4})\)')
+_VOL_RE = re.compile(r'\\textbf\{([^}]+)\}(?:\(([^)]+)\))?')
+_PAGES_RE = re.compile(r'\b(?:pp?\.\s*)?([0-9]+(?:[-–—]+[0-9]+)?|e[0-9]+)\b\s*\.?\s*$')
+_PAGES_STRIP_RE = re.compile(r'\b(?:pp?\.\s*)?[0-9]+(?:[-–—]+[0-9]+)?|e[0-9]+\b\s*\.?\s*$')
+_WS_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\S+')
+# Substrings that mark a comma-separated part as a journal/venue (matched on casefolded text)
+_JOURNAL_KEYWORDS_RE = re.compile(
+    r'journal|proceedings|conference|transactions|letters|ieee|acm|springer|elsevier'
+    r'|science|nature|mathematics|physics|computing|engineering'
+)
+_NONWORD_RE = re.compile(r'[^\w\s]')
+# Same filter as _NONWORD_RE.sub('', ...) for ASCII text, applied with str.translate;
+# every code point is listed so lookups never miss
+_ASCII_NONWORD_TABLE = {
+    code: None if _NONWORD_RE.match(chr(code)) else code for code in range(128)
+}
+
+# Author names already in F.M. Last style (covers "F. Last" and "F.M. Last")
+_AUTHOR_FMT_RE = re.compile(r'^[A-Z]\.[A-Z]*\.?\s+[A-Z][a-zA-Z]+')
+
+# Common misspellings in academic papers
+_COMMON_MISSPELLINGS = {
+    'machien': 'machine',
+    'learing': 'learning',
+    'algoritm': 'algorithm',
+    'anaylsis': 'analysis',
+    'performace': 'performance',
+    'clasification': 'classification',
+    'optimiztion': 'optimization',
+    'recogntion': 'recognition',
+    'procesing': 'processing',
+    'netowrk': 'network',
+    'artifical': 'artificial',
+    'inteligence': 'intelligence',
+    'expermental': 'experimental',
+    'comparision': 'comparison',
+    'implemention': 'implementation',
+    'evalution': 'evaluation'
+}
+# All misspellings as one alternation, so a title is scanned once rather than once per entry
+_SPELLING_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(wrong) for wrong in _COMMON_MISSPELLINGS) + r')\b',
+    re.IGNORECASE
+)
+# Joins titles so the whole batch is spell-checked in one pass
+_RECORD_SEPARATOR = '\x1e'
+
+# Common words for spell checking
+_COMMON_WORDS = frozenset({
+    # Common academic words
+    'the', 'and', 'of', 'in', 'for', 'on', 'with', 'by', 'from', 'to', 'at',
+    'analysis', 'approach', 'method', 'system', 'model', 'algorithm', 'framework',
+    'learning', 'machine', 'deep', 'neural', 'network', 'networks', 'artificial',
+    'intelligence', 'data', 'mining', 'processing', 'classification', 'prediction',
+    'optimization', 'performance', 'evaluation', 'experimental', 'results',
+    'application', 'applications', 'based', 'using', 'novel', 'improved',
+    'efficient', 'effective', 'robust', 'scalable', 'automatic', 'automated',
+    # Scientific terms
+    'research', 'study', 'investigation', 'survey', 'review', 'comparison',
+    'implementation', 'development', 'design', 'architecture', 'structure',
+    'feature', 'features', 'extraction', 'selection', 'detection', 'recognition',
+    'clustering', 'regression', 'supervised', 'unsupervised', 'reinforcement'
+})
+
+# Words kept lowercase inside titles
+_TITLE_SMALL_WORDS = frozenset({
+    'of', 'the', 'and', 'in', 'on', 'for', 'with', 'by', 'from', 'to', 'at', 'a', 'an'
+})
+# Words kept lowercase in unknown journal names
+_JOURNAL_SMALL_WORDS = frozenset({'of', 'the', 'and', 'in', 'on', 'for', 'with'})
+
+# Common journal names and their correct formats
+_JOURNAL_NAMES = {
+    # Nature journals
+    'nature': 'Nature',
+    'nature machine intelligence': 'Nature Machine Intelligence',
+    'nature communications': 'Nature Communications',
+    'nature methods': 'Nature Methods',
+
+    # IEEE journals
+    'ieee': 'IEEE',
+    'ieee transactions on pattern analysis and machine intelligence': 'IEEE Transactions on Pattern Analysis and Machine Intelligence',
+    'ieee transactions on neural networks and learning systems': 'IEEE Transactions on Neural Networks and Learning Systems',
+    'ieee transactions on image processing': 'IEEE Transactions on Image Processing',
+    'ieee transactions on knowledge and data engineering': 'IEEE Transactions on Knowledge and Data Engineering',
+
+    # ACM journals
+    'acm': 'ACM',
+    'acm computing surveys': 'ACM Computing Surveys',
+    'acm transactions on graphics': 'ACM Transactions on Graphics',
+
+    # Other major journals
+    'science': 'Science',
+    'cell': 'Cell',
+    'lancet': 'The Lancet',
+    'pnas': 'Proceedings of the National Academy of Sciences',
+    'journal of machine learning research': 'Journal of Machine Learning Research',
+    'artificial intelligence': 'Artificial Intelligence',
+    'machine learning': 'Machine Learning',
+
+    # Conferences
+    'neurips': 'Advances in Neural Information Processing Systems',
+    'icml': 'International Conference on Machine Learning',
+    'iclr': 'International Conference on Learning Representations',
+    'aaai': 'AAAI Conference on Artificial Intelligence',
+    'ijcai': 'International Joint Conference on Artificial Intelligence',
+    'cvpr': 'IEEE Conference on Computer Vision and Pattern Recognition',
+    'iccv': 'IEEE International Conference on Computer Vision',
+    'eccv': 'European Conference on Computer Vision'
+}
+_JOURNAL_NAMES_LOWER = {name.casefold(): correct for name, correct in _JOURNAL_NAMES.items()}
+_JOURNAL_CORRECT = tuple(_JOURNAL_NAMES_LOWER.values())
+
+# Finds every known name inside a journal string in one pass; values are positions in _JOURNAL_NAMES
+if ahocorasick is not None:
+    _JOURNAL_AUTOMATON = ahocorasick.Automaton()
+    for _index, _name in enumerate(_JOURNAL_NAMES_LOWER):
+        _JOURNAL_AUTOMATON.add_word(_name, _index)
+    _JOURNAL_AUTOMATON.make_automaton()
+else:
+    _JOURNAL_AUTOMATON = None
+
+# Known names joined by NUL, so the first name containing a journal string is one str.find away
+_JOURNAL_NAMES_JOINED = '\0'.join(_JOURNAL_NAMES_LOWER)
+_JOURNAL_NAME_STARTS = list(accumulate((len(name) + 1 for name in _JOURNAL_NAMES_LOWER), initial=0))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _osa_distance(a, b):
+        """Damerau-Levenshtein (optimal string alignment) distance between two uint8 arrays."""
+        n, m = a.shape[0], b.shape[0]
+        before = np.zeros(m + 1, np.int64)
+        previous = np.arange(m + 1)
+        current = np.zeros(m + 1, np.int64)
+        for i in range(1, n + 1):
+            current[0] = i
+            for j in range(1, m + 1):
+                cost = 0 if a[i - 1] == b[j - 1] else 1
+                best = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+                if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                    best = min(best, before[j - 2] + 1)
+                current[j] = best
+            before, previous, current = previous, current, before
+        return previous[m]
+
+    def _lev_ratio(s1: str, s2: str) -> float:
+        """1 - normalized Damerau-Levenshtein distance, computed on UTF-8 bytes."""
+        b1, b2 = s1.encode('utf-8'), s2.encode('utf-8')
+        longest = max(len(b1), len(b2))
+        if not longest:
+            return 1.0
+        distance = _osa_distance(np.frombuffer(b1, dtype=np.uint8), np.frombuffer(b2, dtype=np.uint8))
+        return 1.0 - distance / longest
+else:
+    _lev_ratio = None
+
+
+def _remove_spans(text: str, spans: List[Tuple[int, int]]) -> str:
+    """Return text with the given sorted, non-overlapping (start, end) spans cut out."""
+    pieces = []
+    last = 0
+    for start, end in spans:
+        pieces.append(text[last:start])
+        last = end
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+
+def _strip_nonword(text: str) -> str:
+    """Delete every character that is neither a word character nor whitespace."""
+    if text.isascii():
+        return text.translate(_ASCII_NONWORD_TABLE)
+    return _NONWORD_RE.sub('', text)
+
+
+def _iter_bibtex_fields(fields: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (name, value) for each field of a BibTeX entry body, in one pass.
+    
+    Values may be {braced} (nested braces are kept), "quoted" or bare (e.g. year = 2015).
+    Empty values are skipped and scanning stops at an unbalanced brace or quote.
+    """
+    pos = 0
+    end = len(fields)
+    while True:
+        name_match = _FIELD_NAME_RE.search(fields, pos)
+        if name_match is None or name_match.end() >= end:
+            return
+        name = name_match.group(1)
+        start = name_match.end()
+        opener = fields[start]
+        
+        if opener in '{"':
+            # Walk brace/quote tokens until the value's own delimiter closes at depth 0
+            token_re = _BRACE_RE if opener == '{' else _QUOTE_OR_BRACE_RE
+            depth = 1 if opener == '{' else 0
+            pos = start + 1
+            while True:
+                token = token_re.search(fields, pos)
+                if token is None:
+                    return
+                pos = token.end()
+                char = token.group()
+                if char == '{':
+                    depth += 1
+                elif char == '}':
+                    depth -= 1
+                    if depth == 0 and opener == '{':
+                        break
+                elif depth == 0:  # closing quote
+                    break
+            value = fields[start + 1:pos - 1]
+        else:
+            bare = _BARE_VALUE_RE.match(fields, start)
+            if bare is None:
+                pos = start
+                continue
+            value = bare.group()
+            pos = bare.end()
+        
+        if value.strip():
+            yield name, value
+
+
+def _clean_doi(doi: str) -> str:
+    """Strip a DOI's URL/scheme prefix and lowercase it (DOIs are case-insensitive)."""
+    clean_doi = doi.strip()
+    prefix = _DOI_PREFIX_RE.match(clean_doi)
+    if prefix:
+        clean_doi = clean_doi[prefix.end():]
+    return clean_doi.lower()
+
+
+def _load_crossref_json(body: bytes) -> Any:
+    """Decode a CrossRef response body."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _slim_work(work: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a CrossRef work onto _CROSSREF_WORK_FIELDS, keeping only author names."""
+    slim = {field: work[field] for field in _CROSSREF_WORK_FIELDS if field in work}
+    if isinstance(slim.get('author'), list):
+        slim['author'] = [
+            {part: author[part] for part in ('given', 'family') if part in author}
+            for author in slim['author']
+        ]
+    return slim
+
+
+def _slim_crossref_body(data: Any) -> Any:
+    """Slim the work, or list of works, in a CrossRef response body (other bodies pass through)."""
+    message = data.get('message') if isinstance(data, dict) else None
+    if not isinstance(message, dict):
+        return data
+    if isinstance(message.get('items'), list):
+        return {'message': {**message, 'items': [_slim_work(item) for item in message['items']]}}
+    return {'message': _slim_work(message)}
+
+
+def _text_similarity(a: str, b: str) -> float:
+    """Normalized edit similarity of two strings in [0, 1]."""
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
+    if _lev_ratio is not None:
+        return _lev_ratio(a, b)
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+def _author_similarity(a: str, b: str) -> float:
+    """Similarity of two '|'-joined last name lists, tolerant of extra or reordered names."""
+    if fuzz is not None:
+        return fuzz.token_set_ratio(a.replace('|', ' '), b.replace('|', ' ')) / 100.0
+    return _text_similarity(a, b)
+
+
+def _best_title_match(clean_title: str, items: List[Dict]) -> Tuple[Optional[Dict], float]:
+    """
+    Pick the CrossRef item whose title best matches clean_title.
+    
+    Scores are 0.7 * edit similarity + 0.3 * word overlap and must exceed 0.5.
+    The cheap word overlap is computed first: it bounds the best score a
+    candidate can reach, so candidates that cannot beat the current best skip
+    the edit similarity, and the rest pass the similarity they need as a
+    rapidfuzz score_cutoff.
+    """
+    title_lower = clean_title.lower()
+    title_words = set(title_lower.split())
+    best_match = None
+    best_similarity = 0
+    
+    for item in items:
+        if not item.get('title'):
+            continue
+        crossref_title = (item['title'][0] if isinstance(item['title'], list) else item['title']).lower()
+        crossref_words = set(crossref_title.split())
+        word_overlap = len(title_words & crossref_words) / max(len(title_words), len(crossref_words), 1)
+        
+        # Edit similarity needed for the combined score to beat the threshold and the best so far
+        needed = (max(best_similarity, 0.5) - word_overlap * 0.3) / 0.7
+        if needed >= 1.0:
+            continue
+        if fuzz is not None:
+            similarity = fuzz.ratio(title_lower, crossref_title, score_cutoff=max(0.0, needed * 100 - 1e-6)) / 100.0
+        else:
+            similarity = _text_similarity(title_lower, crossref_title)
+        
+        # Combined score (similarity + word overlap)
+        combined_score = (similarity * 0.7) + (word_overlap * 0.3)
+        if combined_score > best_similarity and combined_score > 0.5:
+            best_similarity = combined_score
+            best_match = item
+    
+    return best_match, best_similarity
+
+
+def _fix_misspelling(match: re.Match) -> str:
+    """re.sub callback: the correct spelling of a matched misspelling."""
+    return _COMMON_MISSPELLINGS[match.group(0).lower()]
+
+
+@lru_cache(maxsize=4096)
+def _correct_author_format(authors: str) -> str:
+    """Correct author name format to F.M. Last style without changing case incorrectly."""
+    if not authors:
+        return authors
+
+    # Split multiple authors
+    author_list = [a.strip() for a in authors.split(',')]
+    corrected_authors = []
+
+    for author in author_list:
+        if not author:
+            continue
+
+        # Check if already in correct format (F.M. Last)
+        if _AUTHOR_FMT_RE.match(author):
+            corrected_authors.append(author)
+            continue
+
+        # Try to parse and correct
+        parts = author.split()
+        if len(parts) >= 2:
+            # Last part is surname (keep original case)
+            surname = parts[-1]
+
+            # First parts are given names
+            given_names = parts[:-1]
+            initials = []
+
+            for name in given_names:
+                if len(name) == 1:
+                    initials.append(f"{name.upper()}.")
+                elif len(name) > 1:
+                    # If it's already an initial (like "A."), keep it
+                    if name.endswith('.') and len(name) <= 3:
+                        initials.append(name.upper())
+                    else:
+                        initials.append(f"{name[0].upper()}.")
+
+            corrected_author = f"{''.join(initials)} {surname}"
+            corrected_authors.append(corrected_author)
+        else:
+            corrected_authors.append(author)  # Keep as-is if can't parse
+
+    return sys.intern(', '.join(corrected_authors))
+
+
+@lru_cache(maxsize=4096)
+def _correct_title_format(title: str) -> str:
+    """Correct title capitalization properly (preserve proper nouns and important words)."""
+    if not title:
+        return title
+
+    # Remove extra whitespace
+    title = ' '.join(title.split())
+
+    # Don't change case if title is already properly formatted
+    if title[0].isupper() and not title.isupper():
+        return title
+
+    # Convert to title case but preserve certain patterns
+    return _WORD_RE.sub(_fix_title_word, title)
+
+
+def _fix_title_word(match: re.Match) -> str:
+    """Title-case one whitespace-delimited word of a title."""
+    word = match.group(0)
+    # First word is always capitalized
+    if match.start() == 0:
+        return word.capitalize()
+    # Don't change words that are already properly capitalized
+    if word[0].isupper() and not word.isupper():
+        return word
+    # Small words stay lowercase unless they're the first word
+    lowered = word.lower()
+    if lowered in _TITLE_SMALL_WORDS:
+        return lowered
+    # Capitalize other words
+    return word.capitalize()
+
+
+def _partial_journal_match(journal_lower: str) -> Optional[int]:
+    """
+    Index of the first known journal that contains, or is contained in, journal_lower.
+    
+    Equivalent to testing both directions against each known name in order, but
+    done as one automaton pass over the input plus one find over the joined names.
+    """
+    best = len(_JOURNAL_CORRECT)
+    
+    if _JOURNAL_AUTOMATON is not None:
+        for _, index in _JOURNAL_AUTOMATON.iter(journal_lower):
+            if index < best:
+                best = index
+    else:
+        for index, known_journal_lower in enumerate(_JOURNAL_NAMES_LOWER):
+            if known_journal_lower in journal_lower:
+                best = index
+                break
+    
+    if '\0' not in journal_lower:
+        position = _JOURNAL_NAMES_JOINED.find(journal_lower)
+        if position != -1:
+            best = min(best, bisect_right(_JOURNAL_NAME_STARTS, position) - 1)
+    
+    return best if best < len(_JOURNAL_CORRECT) else None
+
+
+@lru_cache(maxsize=4096)
+def _correct_journal_format(journal: str) -> str:
+    """Correct journal name format."""
+    if not journal:
+        return journal
+
+    journal_lower = journal.casefold().strip()
+
+    # Check against known journal names
+    correct_name = _JOURNAL_NAMES_LOWER.get(journal_lower)
+    if correct_name is not None:
+        return correct_name
+
+    # Check partial matches
+    match = _partial_journal_match(journal_lower)
+    if match is not None:
+        return _JOURNAL_CORRECT[match]
+
+    # Basic capitalization correction
+    corrected_words = []
+    for word in journal.split():
+        lowered = word.lower()
+        corrected_words.append(lowered if lowered in _JOURNAL_SMALL_WORDS else word.capitalize())
+
+    return sys.intern(' '.join(corrected_words))
+
+
+class _TokenBucket:
+    """
+    Async token bucket allowing `rate` acquisitions per second, in bursts of up to `rate`.
+    
+    Each acquire reserves a token immediately and sleeps off any deficit, so
+    concurrent tasks queue fairly without a lock.
+    """
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+    
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
 class ReferenceValidationResult:
     """Result of reference validation process."""
     
@@ -60,11 +667,48 @@ class ReferenceValidationResult:
 class ReferenceValidator(BaseAgent):
     """Agent for validating and correcting reference files."""
     
-    def __init__(self, memory_store=None):
+    def __init__(self, memory_store=None, session: Optional[Any] = None,
+                 cache_path: Optional[str] = _CROSSREF_DISK_CACHE_PATH):
+        """
+        Args:
+            memory_store: Optional shared memory store
+            session: Optional caller-owned aiohttp session for CrossRef
+            cache_path: SQLite file persisting CrossRef answers across runs, or None to disable it
+        """
         super().__init__("ReferenceValidator", memory_store)
-        self.common_words = self._load_common_words()
-        self.journal_names = self._load_journal_names()
-        self.author_patterns = self._load_author_patterns()
+        # Optional caller-owned aiohttp session for CrossRef; otherwise one is opened per verification run
+        self.session = session
+        self.common_words = _COMMON_WORDS
+        self.journal_names = _JOURNAL_NAMES
+        
+        # 'doi:<doi>' / 'title:<digest>' -> (status, body) for definitive CrossRef answers (200/404), LRU-bounded
+        self._crossref_responses: OrderedDict = OrderedDict()
+        
+        # The same answers persisted across runs
+        self._response_cache = None
+        if cache_path is not None:
+            try:
+                self._response_cache = DOICache(cache_path)
+            except Exception as e:
+                self.logger.warning(f"CrossRef response cache unavailable, lookups will not persist: {str(e)}")
+        
+        # cache_key -> in-flight CrossRef request, so concurrent lookups of one DOI/title share it
+        self._crossref_pending: Dict[str, asyncio.Future] = {}
+        
+        # Keep-alive requests session for the blocking fallback, created on first use
+        self._requests_session = None
+        
+        # Paces uncached CrossRef requests across all concurrent lookups
+        self._crossref_limiter = _TokenBucket(_CROSSREF_RATE_LIMIT)
+    
+    def close(self) -> None:
+        """Release the disk cache connection and the blocking-fallback HTTP session."""
+        if self._response_cache is not None:
+            self._response_cache.close()
+            self._response_cache = None
+        if self._requests_session is not None:
+            self._requests_session.close()
+            self._requests_session = None
     
     async def process(self, input_data):
         """Required abstract method implementation."""
@@ -78,74 +722,6 @@ class ReferenceValidator(BaseAgent):
         else:
             raise ValueError("Invalid input data for reference validation")
         
-    def _load_common_words(self) -> Set[str]:
-        """Load common words for spell checking."""
-        return {
-            # Common academic words
-            'the', 'and', 'of', 'in', 'for', 'on', 'with', 'by', 'from', 'to', 'at',
-            'analysis', 'approach', 'method', 'system', 'model', 'algorithm', 'framework',
-            'learning', 'machine', 'deep', 'neural', 'network', 'networks', 'artificial',
-            'intelligence', 'data', 'mining', 'processing', 'classification', 'prediction',
-            'optimization', 'performance', 'evaluation', 'experimental', 'results',
-            'application', 'applications', 'based', 'using', 'novel', 'improved',
-            'efficient', 'effective', 'robust', 'scalable', 'automatic', 'automated',
-            # Scientific terms
-            'research', 'study', 'investigation', 'survey', 'review', 'comparison',
-            'implementation', 'development', 'design', 'architecture', 'structure',
-            'feature', 'features', 'extraction', 'selection', 'detection', 'recognition',
-            'clustering', 'regression', 'supervised', 'unsupervised', 'reinforcement'
-        }
-    
-    def _load_journal_names(self) -> Dict[str, str]:
-        """Load common journal names and their correct formats."""
-        return {
-            # Nature journals
-            'nature': 'Nature',
-            'nature machine intelligence': 'Nature Machine Intelligence',
-            'nature communications': 'Nature Communications',
-            'nature methods': 'Nature Methods',
-            
-            # IEEE journals
-            'ieee': 'IEEE',
-            'ieee transactions on pattern analysis and machine intelligence': 'IEEE Transactions on Pattern Analysis and Machine Intelligence',
-            'ieee transactions on neural networks and learning systems': 'IEEE Transactions on Neural Networks and Learning Systems',
-            'ieee transactions on image processing': 'IEEE Transactions on Image Processing',
-            'ieee transactions on knowledge and data engineering': 'IEEE Transactions on Knowledge and Data Engineering',
-            
-            # ACM journals
-            'acm': 'ACM',
-            'acm computing surveys': 'ACM Computing Surveys',
-            'acm transactions on graphics': 'ACM Transactions on Graphics',
-            
-            # Other major journals
-            'science': 'Science',
-            'cell': 'Cell',
-            'lancet': 'The Lancet',
-            'pnas': 'Proceedings of the National Academy of Sciences',
-            'journal of machine learning research': 'Journal of Machine Learning Research',
-            'artificial intelligence': 'Artificial Intelligence',
-            'machine learning': 'Machine Learning',
-            
-            # Conferences
-            'neurips': 'Advances in Neural Information Processing Systems',
-            'icml': 'International Conference on Machine Learning',
-            'iclr': 'International Conference on Learning Representations',
-            'aaai': 'AAAI Conference on Artificial Intelligence',
-            'ijcai': 'International Joint Conference on Artificial Intelligence',
-            'cvpr': 'IEEE Conference on Computer Vision and Pattern Recognition',
-            'iccv': 'IEEE International Conference on Computer Vision',
-            'eccv': 'European Conference on Computer Vision'
-        }
-    
-    def _load_author_patterns(self) -> List[str]:
-        """Load common author name patterns for validation."""
-        return [
-            r'^[A-Z]\. [A-Z][a-z]+$',  # F. Last
-            r'^[A-Z]\.[A-Z]\. [A-Z][a-z]+$',  # F.M. Last
-            r'^[A-Z][a-z]+ [A-Z][a-z]+$',  # First Last
-            r'^[A-Z]\. [A-Z]\. [A-Z][a-z]+$',  # F. M. Last
-        ]
-    
     async def process_reference_file(self, file_content: str, file_format: str = 'bibtex') -> ReferenceValidationResult:
         """
         Process and validate a reference file.
@@ -170,12 +746,9 @@ class ReferenceValidator(BaseAgent):
             unique_references = await self._remove_duplicates(references, result)
             result.processing_log.append(f"Removed {len(references) - len(unique_references)} duplicates")
             
-            # Step 3: Format correction
-            format_corrected = await self._correct_format(unique_references, result)
+            # Steps 3-4: Format, spelling and capitalization correction
+            spell_corrected = self._apply_corrections(unique_references, result)
             result.processing_log.append(f"Applied format corrections to {len(result.format_corrections)} references")
-            
-            # Step 4: Spelling and capitalization correction
-            spell_corrected = await self._correct_spelling_and_caps(format_corrected, result)
             result.processing_log.append(f"Applied spelling/capitalization corrections to {len(result.spelling_corrections)} references")
             
             # Step 5: Verify paper authenticity and data
@@ -200,29 +773,31 @@ class ReferenceValidator(BaseAgent):
         references = []
         
         if file_format.lower() == 'bibitem':
-            # Parse \bibitem{key} format
-            bibitem_pattern = r'\\bibitem\{([^}]+)\}\s*(.+?)(?=\\bibitem|\Z)'
-            matches = re.findall(bibitem_pattern, content, re.DOTALL)
-            
-            for key, ref_text in matches:
+            # Parse \bibitem{key} format, one entry at a time
+            for i, match in enumerate(_BIBITEM_RE.finditer(content)):
+                if i & 0xFF == 0:
+                    await asyncio.sleep(0)  # Let other tasks run during large files
+                key, ref_text = match.group(1), match.group(2)
                 parsed_ref = await self._parse_bibitem_reference(key.strip(), ref_text.strip())
                 if parsed_ref:
                     references.append(parsed_ref)
         
         elif file_format.lower() == 'bibtex':
-            # Parse BibTeX format
-            bibtex_pattern = r'@(\w+)\{([^,]+),\s*(.+?)\n\}'
-            matches = re.findall(bibtex_pattern, content, re.DOTALL)
-            
-            for entry_type, key, fields in matches:
+            # Parse BibTeX format, one entry at a time
+            for i, match in enumerate(_BIBTEX_ENTRY_RE.finditer(content)):
+                if i & 0xFF == 0:
+                    await asyncio.sleep(0)
+                entry_type, key, fields = match.groups()
                 parsed_ref = await self._parse_bibtex_reference(entry_type, key.strip(), fields)
                 if parsed_ref:
                     references.append(parsed_ref)
         
         else:  # plain text format
-            # Split by lines and try to parse each line as a reference
-            lines = [line.strip() for line in content.split('\n') if line.strip()]
-            for i, line in enumerate(lines):
+            # Try to parse each non-empty line as a reference
+            lines = (line.strip() for line in content.splitlines())
+            for i, line in enumerate(line for line in lines if line):
+                if i & 0xFF == 0:
+                    await asyncio.sleep(0)
                 parsed_ref = await self._parse_plain_reference(f"ref_{i+1}", line)
                 if parsed_ref:
                     references.append(parsed_ref)
@@ -242,38 +817,39 @@ class ReferenceValidator(BaseAgent):
             clean_text = ref_text.strip()
             
             # Step 1: Extract DOI/URL first (at the end)
-            doi_match = re.search(r'(https?://[^\s]+)\.?\s*$', clean_text)
+            doi_match = _TRAILING_URL_RE.search(clean_text)
             if doi_match:
                 ref_data['doi'] = doi_match.group(1)
                 clean_text = clean_text[:doi_match.start()].strip()
             
             # Step 2: Extract year (in parentheses, usually near the end)
-            year_matches = re.findall(r'\((\d{4})\)', clean_text)
+            year_matches = list(_YEAR_RE.finditer(clean_text))
             if year_matches:
                 # Take the last year found (most likely the publication year)
-                ref_data['year'] = int(year_matches[-1])
-                # Remove the year from text for further parsing
-                year_pattern = r'\(' + str(year_matches[-1]) + r'\)'
-                clean_text = re.sub(year_pattern, '', clean_text, count=1, flags=re.IGNORECASE)
-                clean_text = clean_text.strip()
+                year = year_matches[-1].group(1)
+                ref_data['year'] = int(year)
+                # Remove the first occurrence of that year from text for further parsing
+                year_span = next(m.span() for m in year_matches if m.group(1) == year)
+                clean_text = _remove_spans(clean_text, [year_span]).strip()
             
             # Step 3: Extract volume and issue (pattern: \textbf{vol}(issue) or \textbf{vol})
-            volume_issue_match = re.search(r'\\textbf\{([^}]+)\}(?:\(([^)]+)\))?', clean_text)
-            if volume_issue_match:
+            volume_issue_matches = list(_VOL_RE.finditer(clean_text))
+            if volume_issue_matches:
+                volume_issue_match = volume_issue_matches[0]
                 ref_data['volume'] = volume_issue_match.group(1).strip()
                 if volume_issue_match.group(2):
                     ref_data['issue'] = volume_issue_match.group(2).strip()
-                # Remove volume/issue from text
-                clean_text = re.sub(r'\\textbf\{[^}]+\}(?:\([^)]+\))?', '', clean_text).strip()
+                # Remove every volume/issue from text
+                clean_text = _remove_spans(clean_text, [m.span() for m in volume_issue_matches]).strip()
             
             # Step 4: Extract pages (remaining numbers/ranges after removing volume/issue/year)
             # Look for page patterns like "123-456", "123--456", "123", "e123456"
             # Be more specific about page patterns to avoid false matches
-            pages_match = re.search(r'\b(?:pp?\.\s*)?([0-9]+(?:[-–—]+[0-9]+)?|e[0-9]+)\b\s*\.?\s*$', clean_text)
+            pages_match = _PAGES_RE.search(clean_text)
             if pages_match:
                 ref_data['pages'] = pages_match.group(1).strip()
                 # Remove pages from text
-                clean_text = re.sub(r'\b(?:pp?\.\s*)?[0-9]+(?:[-–—]+[0-9]+)?|e[0-9]+\b\s*\.?\s*$', '', clean_text).strip()
+                clean_text = _PAGES_STRIP_RE.sub('', clean_text).strip()
             
             # Step 5: Now parse Authors, Title, Journal from remaining text
             # The format is: Authors, Title, Journal
@@ -303,6 +879,7 @@ class ReferenceValidator(BaseAgent):
                 
                 for i, part in enumerate(parts):
                     words = part.split()
+                    part_lower = part.casefold()
                     
                     # Check if this looks like an author name (short, has initials or names)
                     is_author_like = (
@@ -314,11 +891,7 @@ class ReferenceValidator(BaseAgent):
                     )
                     
                     # Check if this looks like a journal name
-                    is_journal_like = any(keyword in part.lower() for keyword in [
-                        'journal', 'proceedings', 'conference', 'transactions', 'letters',
-                        'ieee', 'acm', 'springer', 'elsevier', 'science', 'nature',
-                        'mathematics', 'physics', 'computing', 'engineering'
-                    ])
+                    is_journal_like = _JOURNAL_KEYWORDS_RE.search(part_lower) is not None
                     
                     if in_authors and is_author_like and not is_journal_like:
                         author_parts.append(part)
@@ -350,7 +923,8 @@ class ReferenceValidator(BaseAgent):
                 # Only 2 parts - likely Authors, Title or Authors, Journal
                 ref_data['authors'] = parts[0].strip()
                 # Check if second part looks like a journal
-                if any(keyword in parts[1].lower() for keyword in ['journal', 'proceedings', 'conference']):
+                second_lower = parts[1].casefold()
+                if any(keyword in second_lower for keyword in ('journal', 'proceedings', 'conference')):
                     ref_data['journal'] = parts[1].strip()
                 else:
                     ref_data['title'] = parts[1].strip()
@@ -362,7 +936,12 @@ class ReferenceValidator(BaseAgent):
             for field in ['authors', 'title', 'journal']:
                 if field in ref_data:
                     # Remove extra whitespace and trailing punctuation
-                    ref_data[field] = re.sub(r'\s+', ' ', ref_data[field]).strip(' .,;')
+                    ref_data[field] = _WS_RE.sub(' ', ref_data[field]).strip(' .,;')
+            
+            # Authors and venues repeat across a bibliography; share one string object each
+            for field in ('authors', 'journal'):
+                if field in ref_data:
+                    ref_data[field] = sys.intern(ref_data[field])
             
             return ref_data
             
@@ -380,19 +959,16 @@ class ReferenceValidator(BaseAgent):
             }
             
             # Parse fields
-            field_pattern = r'(\w+)\s*=\s*\{([^}]+)\}'
-            field_matches = re.findall(field_pattern, fields)
-            
-            for field_name, field_value in field_matches:
+            for field_name, field_value in _iter_bibtex_fields(fields):
                 field_name = field_name.lower().strip()
                 field_value = field_value.strip()
                 
                 if field_name == 'author':
-                    ref_data['authors'] = field_value
+                    ref_data['authors'] = sys.intern(field_value)
                 elif field_name == 'title':
                     ref_data['title'] = field_value
                 elif field_name in ['journal', 'booktitle', 'venue']:
-                    ref_data['journal'] = field_value
+                    ref_data['journal'] = sys.intern(field_value)
                 elif field_name == 'year':
                     try:
                         ref_data['year'] = int(field_value)
@@ -426,12 +1002,12 @@ class ReferenceValidator(BaseAgent):
             
             # Basic parsing - this is more heuristic
             # Try to identify year
-            year_match = re.search(r'\((\d{4})\)', ref_text)
+            year_match = _YEAR_RE.search(ref_text)
             if year_match:
                 ref_data['year'] = int(year_match.group(1))
             
             # Try to identify DOI
-            doi_match = re.search(r'https?://[^\s]+', ref_text)
+            doi_match = _URL_RE.search(ref_text)
             if doi_match:
                 ref_data['doi'] = doi_match.group(0)
             
@@ -449,42 +1025,127 @@ class ReferenceValidator(BaseAgent):
         unique_refs = []
         seen_signatures = []
         
-        for ref in references:
-            # Create comprehensive signature for duplicate detection
-            signature = self._create_comprehensive_signature(ref)
-            
+        # DOIs are definitive, so they are matched by hash; fuzzy comparison is
+        # restricted to references sharing a (last name, year) block. Near-duplicates
+        # whose first author or year differ beyond that are no longer caught, and a
+        # match may point at a later reference than a full scan would have found
+        doi_index: Dict[str, int] = {}
+        blocks: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        # Identical signatures are looked up by hash before any fuzzy comparison; the
+        # hit still has to clear the similarity threshold (empty signatures never do)
+        exact_index: Dict[Tuple[str, ...], int] = {}
+        
+        # For very large files titled references are matched through MinHash-LSH
+        # over title shingles instead, which stays near-linear in the file size
+        lsh = None
+        if len(references) > _LSH_MIN_REFERENCES and MinHashLSH is not None:
+            lsh = MinHashLSH(threshold=_LSH_THRESHOLD, num_perm=_MINHASH_NUM_PERM)
+        
+        # Normalize every reference once, kept beside the references rather than on them
+        signatures = [self._create_comprehensive_signature(ref) for ref in references]
+        
+        for ref, signature in zip(references, signatures):
             # Check for duplicates using multiple criteria
-            is_duplicate = False
-            duplicate_reason = ""
-            
-            for i, seen_sig in enumerate(seen_signatures):
-                similarity_score, match_type = self._calculate_similarity(signature, seen_sig)
+            duplicate_of = None
+            minhash = None
+            doi = signature.get('doi')
+            exact_key = self._exact_key(signature)
+            if doi and doi in doi_index:
+                duplicate_of = doi_index[doi]
+                similarity_score, match_type = 1.0, "DOI match"
+            else:
+                exact_match = exact_index.get(exact_key)
+                if exact_match is not None:
+                    similarity_score, match_type = self._calculate_similarity(signature, seen_signatures[exact_match])
+                    if similarity_score > 0.85:
+                        duplicate_of = exact_match
                 
-                if similarity_score > 0.85:  # 85% similarity threshold
-                    is_duplicate = True
-                    duplicate_reason = f"Similar to reference #{i+1} ({match_type}, similarity: {similarity_score:.2f})"
-                    result.duplicates_removed.append({
-                        'reference': ref,
-                        'reason': duplicate_reason,
-                        'signature': signature,
-                        'similar_to_index': i,
-                        'similarity_score': similarity_score
-                    })
-                    break
+                if duplicate_of is None:
+                    if lsh is not None and signature.get('title'):
+                        minhash = title_minhash(signature['title'], _SHINGLE_SIZE, _MINHASH_NUM_PERM)
+                        candidates = sorted(lsh.query(minhash))
+                    else:
+                        candidates = self._candidate_indices(signature, blocks)
+                    
+                    for i in candidates:
+                        similarity_score, match_type = self._calculate_similarity(signature, seen_signatures[i])
+                        
+                        if similarity_score > 0.85:  # 85% similarity threshold
+                            duplicate_of = i
+                            break
             
-            if not is_duplicate:
+            if duplicate_of is not None:
+                duplicate_reason = f"Similar to reference #{duplicate_of+1} ({match_type}, similarity: {similarity_score:.2f})"
+                result.duplicates_removed.append({
+                    'reference': ref,
+                    'reason': duplicate_reason,
+                    'signature': signature,
+                    'similar_to_index': duplicate_of,
+                    'similarity_score': similarity_score
+                })
+            else:
+                index = len(seen_signatures)
                 unique_refs.append(ref)
                 seen_signatures.append(signature)
+                if doi:
+                    doi_index.setdefault(doi, index)
+                if any(exact_key):
+                    exact_index.setdefault(exact_key, index)
+                blocks[self._block_key(signature)].append(index)
+                if minhash is not None:
+                    lsh.insert(index, minhash)
         
         return unique_refs
     
+    @staticmethod
+    def _exact_key(signature: Dict[str, str]) -> Tuple[str, ...]:
+        """Hashable form of a signature; equal keys mean identical signatures."""
+        return (
+            signature.get('doi', ''), signature.get('title', ''), signature.get('authors', ''),
+            signature.get('year', ''), signature.get('journal', '')
+        )
+    
+    @staticmethod
+    def _block_key(signature: Dict[str, str]) -> Tuple[str, str]:
+        """Blocking key for duplicate detection: (first last name, year), '' when unknown."""
+        authors = signature.get('authors', '')
+        return authors.split('|')[0] if authors else '', signature.get('year', '')
+    
+    def _candidate_indices(self, signature: Dict[str, str], blocks: Dict[Tuple[str, str], List[int]]) -> List[int]:
+        """Indices of earlier signatures worth a fuzzy comparison, in insertion order."""
+        last_name, year = self._block_key(signature)
+        
+        # Adjacent years catch preprint/published pairs; unknown values match anything
+        years = None
+        if year:
+            years = {year, ''}
+            if year.isdigit():
+                years.update((str(int(year) - 1), str(int(year) + 1)))
+        last_names = {last_name, ''} if last_name else None
+        
+        candidates = []
+        if last_names is not None and years is not None:
+            # Common case: a handful of direct block lookups
+            for block_last_name in last_names:
+                for block_year in years:
+                    candidates.extend(blocks.get((block_last_name, block_year), ()))
+        else:
+            for (block_last_name, block_year), indices in blocks.items():
+                if last_names is not None and block_last_name not in last_names:
+                    continue
+                if years is not None and block_year not in years:
+                    continue
+                candidates.extend(indices)
+        
+        return sorted(candidates)
+    
     def _create_comprehensive_signature(self, ref: Dict[str, Any]) -> Dict[str, str]:
         """Create a comprehensive signature for duplicate detection."""
         signature = {}
         
         # Normalize title
         if 'title' in ref and ref['title']:
-            title = re.sub(r'[^\w\s]', '', ref['title'].lower())
+            title = _strip_nonword(ref['title'].lower())
             title = ' '.join(title.split())  # Normalize whitespace
             signature['title'] = title
         
@@ -497,7 +1158,7 @@ class ReferenceValidator(BaseAgent):
             for author in author_parts:
                 words = author.split()
                 if words:
-                    last_names.append(words[-1])  # Last word is usually the last name
+                    last_names.append(sys.intern(words[-1]))  # Last word is usually the last name
             signature['authors'] = '|'.join(sorted(last_names))
         
         # Add year
@@ -512,8 +1173,8 @@ class ReferenceValidator(BaseAgent):
         
         # Add journal
         if 'journal' in ref and ref['journal']:
-            journal = re.sub(r'[^\w\s]', '', ref['journal'].lower())
-            signature['journal'] = ' '.join(journal.split())
+            journal = _strip_nonword(ref['journal'].lower())
+            signature['journal'] = sys.intern(' '.join(journal.split()))
         
         return signature
     
@@ -535,9 +1196,11 @@ class ReferenceValidator(BaseAgent):
                 if component == 'year':
                     # Exact match for year
                     similarity = 1.0 if sig1[component] == sig2[component] else 0.0
+                elif component == 'authors':
+                    similarity = _author_similarity(sig1[component], sig2[component])
                 else:
                     # Text similarity for other components
-                    similarity = difflib.SequenceMatcher(None, sig1[component], sig2[component]).ratio()
+                    similarity = _text_similarity(sig1[component], sig2[component])
                 
                 total_similarity += similarity * weight
                 total_weight += weight
@@ -552,157 +1215,92 @@ class ReferenceValidator(BaseAgent):
         
         return 0.0, "no match"
     
-    async def _correct_format(self, references: List[Dict[str, Any]], result: ReferenceValidationResult) -> List[Dict[str, Any]]:
-        """Correct format issues in references."""
-        corrected_refs = []
+    def _apply_corrections(self, references: List[Dict[str, Any]], result: ReferenceValidationResult) -> List[Dict[str, Any]]:
+        """
+        Apply format, then spelling, corrections to every reference.
         
-        for ref in references:
-            corrections = []
-            corrected_ref = ref.copy()
-            
-            # Validate and fix bibitem key
-            key_correction = self._validate_and_fix_bibitem_key(corrected_ref)
-            if key_correction:
-                corrections.append(f"{key_correction['field']}: '{key_correction['before']}' → '{key_correction['after']}'")
-            
-            # Correct author format
-            if 'authors' in ref:
-                original_authors = ref['authors']
-                corrected_authors = self._correct_author_format(original_authors)
-                if corrected_authors != original_authors:
-                    corrected_ref['authors'] = corrected_authors
-                    corrections.append(f"Authors: '{original_authors}' → '{corrected_authors}'")
-            
-            # Correct title format
-            if 'title' in ref:
-                original_title = ref['title']
-                corrected_title = self._correct_title_format(original_title)
-                if corrected_title != original_title:
-                    corrected_ref['title'] = corrected_title
-                    corrections.append(f"Title: '{original_title}' → '{corrected_title}'")
-            
-            # Correct journal format
-            if 'journal' in ref:
-                original_journal = ref['journal']
-                corrected_journal = self._correct_journal_format(original_journal)
-                if corrected_journal != original_journal:
-                    corrected_ref['journal'] = corrected_journal
-                    corrections.append(f"Journal: '{original_journal}' → '{corrected_journal}'")
-            
-            if corrections:
-                result.format_corrections.append({
-                    'reference_key': corrected_ref.get('key', 'unknown'),
-                    'corrections': corrections
+        Format fixes are worked out per reference; title spelling is then fixed
+        for the whole batch in one regex pass. References that need no fixing are
+        returned as they are, the rest as corrected copies.
+        """
+        all_updates = [self._format_updates(ref, result) for ref in references]
+        
+        # Check title spelling on the format-corrected titles
+        titled = [i for i, ref in enumerate(references) if 'title' in ref]
+        original_titles = [all_updates[i].get('title', references[i]['title']) for i in titled]
+        corrected_titles = self._correct_spelling_batch(original_titles)
+        for i, original_title, corrected_title in zip(titled, original_titles, corrected_titles):
+            if corrected_title != original_title:
+                all_updates[i]['title'] = corrected_title
+                result.spelling_corrections.append({
+                    'reference_key': all_updates[i].get('key', references[i].get('key', 'unknown')),
+                    'corrections': [f"Title spelling: '{original_title}' → '{corrected_title}'"]
                 })
-            
-            corrected_refs.append(corrected_ref)
+        
+        corrected_refs = []
+        for ref, updates in zip(references, all_updates):
+            if not updates:
+                corrected_refs.append(ref)
+                continue
+            # Copy only when something changed
+            corrected_refs.append({**ref, **updates})
         
         return corrected_refs
     
-    def _correct_author_format(self, authors: str) -> str:
-        """Correct author name format to F.M. Last style without changing case incorrectly."""
-        if not authors:
-            return authors
-        
-        # Split multiple authors
-        author_list = [a.strip() for a in authors.split(',')]
-        corrected_authors = []
+    def _format_updates(self, ref: Dict[str, Any], result: ReferenceValidationResult) -> Dict[str, Any]:
+        """Work out the key, author, title and journal format fixes for one reference, logging them in result."""
+        corrections = []
+        updates = {}
+        
+        # Validate and fix bibitem key
+        key_correction = self._bibitem_key_correction(ref)
+        if key_correction:
+            updates['key'] = key_correction['after']
+            corrections.append(f"{key_correction['field']}: '{key_correction['before']}' → '{key_correction['after']}'")
+        
+        # Correct author format
+        if 'authors' in ref:
+            original_authors = ref['authors']
+            corrected_authors = self._correct_author_format(original_authors)
+            if corrected_authors != original_authors:
+                updates['authors'] = corrected_authors
+                corrections.append(f"Authors: '{original_authors}' → '{corrected_authors}'")
+        
+        # Correct title format
+        if 'title' in ref:
+            original_title = ref['title']
+            corrected_title = self._correct_title_format(original_title)
+            if corrected_title != original_title:
+                updates['title'] = corrected_title
+                corrections.append(f"Title: '{original_title}' → '{corrected_title}'")
+        
+        # Correct journal format
+        if 'journal' in ref:
+            original_journal = ref['journal']
+            corrected_journal = self._correct_journal_format(original_journal)
+            if corrected_journal != original_journal:
+                updates['journal'] = corrected_journal
+                corrections.append(f"Journal: '{original_journal}' → '{corrected_journal}'")
         
-        for author in author_list:
-            if not author:
-                continue
-            
-            # Check if already in correct format (F.M. Last)
-            if re.match(r'^[A-Z]\.[A-Z]*\.?\s+[A-Z][a-zA-Z]+', author):
-                corrected_authors.append(author)
-                continue
-            
-            # Try to parse and correct
-            parts = author.split()
-            if len(parts) >= 2:
-                # Last part is surname (keep original case)
-                surname = parts[-1]
-                
-                # First parts are given names
-                given_names = parts[:-1]
-                initials = []
-                
-                for name in given_names:
-                    if len(name) == 1:
-                        initials.append(f"{name.upper()}.")
-                    elif len(name) > 1:
-                        # If it's already an initial (like "A."), keep it
-                        if name.endswith('.') and len(name) <= 3:
-                            initials.append(name.upper())
-                        else:
-                            initials.append(f"{name[0].upper()}.")
-                
-                corrected_author = f"{''.join(initials)} {surname}"
-                corrected_authors.append(corrected_author)
-            else:
-                corrected_authors.append(author)  # Keep as-is if can't parse
+        if corrections:
+            result.format_corrections.append({
+                'reference_key': updates.get('key', ref.get('key', 'unknown')),
+                'corrections': corrections
+            })
         
-        return ', '.join(corrected_authors)
+        return updates
+    
+    def _correct_author_format(self, authors: str) -> str:
+        """Correct author name format to F.M. Last style without changing case incorrectly."""
+        return _correct_author_format(authors)
     
     def _correct_title_format(self, title: str) -> str:
         """Correct title capitalization properly (preserve proper nouns and important words)."""
-        if not title:
-            return title
-        
-        # Remove extra whitespace
-        title = ' '.join(title.split())
-        
-        # Don't change case if title is already properly formatted
-        if title[0].isupper() and not title.isupper():
-            return title
-        
-        # Convert to title case but preserve certain patterns
-        words = title.split()
-        corrected_words = []
-        
-        for i, word in enumerate(words):
-            # First word is always capitalized
-            if i == 0:
-                corrected_words.append(word.capitalize())
-            # Don't change words that are already properly capitalized
-            elif word[0].isupper() and not word.isupper():
-                corrected_words.append(word)
-            # Small words stay lowercase unless they're the first word
-            elif word.lower() in ['of', 'the', 'and', 'in', 'on', 'for', 'with', 'by', 'from', 'to', 'at', 'a', 'an']:
-                corrected_words.append(word.lower())
-            # Capitalize other words
-            else:
-                corrected_words.append(word.capitalize())
-        
-        return ' '.join(corrected_words)
+        return _correct_title_format(title)
     
     def _correct_journal_format(self, journal: str) -> str:
         """Correct journal name format."""
-        if not journal:
-            return journal
-        
-        journal_lower = journal.lower().strip()
-        
-        # Check against known journal names
-        if journal_lower in self.journal_names:
-            return self.journal_names[journal_lower]
-        
-        # Check partial matches
-        for known_journal_lower, correct_name in self.journal_names.items():
-            if known_journal_lower in journal_lower or journal_lower in known_journal_lower:
-                return correct_name
-        
-        # Basic capitalization correction
-        words = journal.split()
-        corrected_words = []
-        
-        for word in words:
-            if word.lower() in ['of', 'the', 'and', 'in', 'on', 'for', 'with']:
-                corrected_words.append(word.lower())
-            else:
-                corrected_words.append(word.capitalize())
-        
-        return ' '.join(corrected_words)
+        return _correct_journal_format(journal)
     
     def _generate_correct_bibitem_key(self, authors_list, year):
         """Generate correct bibitem key based on authors and year."""
@@ -756,112 +1354,92 @@ class ReferenceValidator(BaseAgent):
         key = "".join(key_parts) + f"{year_suffix:02d}"
         return key
     
-    def _validate_and_fix_bibitem_key(self, ref_data):
-        """Validate and fix bibitem key based on authors."""
+    def _bibitem_key_correction(self, ref_data):
+        """Validate the bibitem key against authors and year; describe the fix, or None if correct."""
         if 'authors' in ref_data and 'year' in ref_data:
             correct_key = self._generate_correct_bibitem_key(ref_data['authors'], ref_data['year'])
             original_key = ref_data.get('key', '')
             
             if original_key != correct_key:
-                ref_data['key'] = correct_key
                 return {
                     'field': 'Bibitem Key',
                     'before': original_key,
                     'after': correct_key
                 }
         return None
-        """Correct journal name format."""
-        if not journal:
-            return journal
-        
-        journal_lower = journal.lower().strip()
-        
-        # Check against known journal names
-        if journal_lower in self.journal_names:
-            return self.journal_names[journal_lower]
-        
-        # Check partial matches
-        for known_journal_lower, correct_name in self.journal_names.items():
-            if known_journal_lower in journal_lower or journal_lower in known_journal_lower:
-                return correct_name
-        
-        # Basic capitalization correction
-        words = journal.split()
-        corrected_words = []
-        
-        for word in words:
-            if word.lower() in ['of', 'the', 'and', 'in', 'on', 'for', 'with']:
-                corrected_words.append(word.lower())
-            else:
-                corrected_words.append(word.capitalize())
-        
-        return ' '.join(corrected_words)
-    
-    async def _correct_spelling_and_caps(self, references: List[Dict[str, Any]], result: ReferenceValidationResult) -> List[Dict[str, Any]]:
-        """Correct spelling and capitalization errors."""
-        corrected_refs = []
-        
-        for ref in references:
-            corrections = []
-            corrected_ref = ref.copy()
-            
-            # Check title spelling
-            if 'title' in ref:
-                original_title = ref['title']
-                corrected_title = self._correct_spelling(original_title)
-                if corrected_title != original_title:
-                    corrected_ref['title'] = corrected_title
-                    corrections.append(f"Title spelling: '{original_title}' → '{corrected_title}'")
-            
-            if corrections:
-                result.spelling_corrections.append({
-                    'reference_key': ref.get('key', 'unknown'),
-                    'corrections': corrections
-                })
-            
-            corrected_refs.append(corrected_ref)
-        
-        return corrected_refs
     
     def _correct_spelling(self, text: str) -> str:
         """Basic spelling correction for common academic terms."""
         if not text:
             return text
         
-        # Common misspellings in academic papers
-        corrections = {
-            'machien': 'machine',
-            'learing': 'learning',
-            'algoritm': 'algorithm',
-            'anaylsis': 'analysis',
-            'performace': 'performance',
-            'clasification': 'classification',
-            'optimiztion': 'optimization',
-            'recogntion': 'recognition',
-            'procesing': 'processing',
-            'netowrk': 'network',
-            'artifical': 'artificial',
-            'inteligence': 'intelligence',
-            'expermental': 'experimental',
-            'comparision': 'comparison',
-            'implemention': 'implementation',
-            'evalution': 'evaluation'
-        }
+        return _SPELLING_RE.sub(_fix_misspelling, text)
+    
+    def _correct_spelling_batch(self, texts: List[str]) -> List[str]:
+        """
+        _correct_spelling over many texts with a single regex pass.
         
-        corrected = text
-        for wrong, right in corrections.items():
-            corrected = re.sub(r'\b' + re.escape(wrong) + r'\b', right, corrected, flags=re.IGNORECASE)
+        The texts are joined with the ASCII record separator, which is a word
+        boundary like the ends of a string, and split back afterwards.
+        """
+        if any(_RECORD_SEPARATOR in text for text in texts if text):
+            return [self._correct_spelling(text) for text in texts]
         
-        return corrected
+        blob = _RECORD_SEPARATOR.join(text or '' for text in texts)
+        corrected = _SPELLING_RE.sub(_fix_misspelling, blob).split(_RECORD_SEPARATOR)
+        # Empty/None titles go back untouched, as _correct_spelling returns them
+        return [fixed if text else text for text, fixed in zip(texts, corrected)]
     
     async def _verify_papers(self, references: List[Dict[str, Any]], result: ReferenceValidationResult) -> List[Dict[str, Any]]:
         """Verify paper authenticity and data accuracy using comprehensive CrossRef validation."""
         verified_refs = []
         
-        for i, ref in enumerate(references):
-            self.logger.info(f"Verifying paper {i+1}/{len(references)}: {ref.get('key', 'unknown')}")
-            
-            verification_result = await self._verify_single_paper(ref)
+        # References with identical bibliographic fields are verified once and share the result
+        distinct_index: Dict[Tuple, int] = {}
+        group_of = []
+        distinct_refs = []
+        for ref in references:
+            content_key = tuple(ref.get(field) for field in _VERIFIED_FIELDS)
+            group = distinct_index.get(content_key)
+            if group is None:
+                group = distinct_index[content_key] = len(distinct_refs)
+                distinct_refs.append(ref)
+            group_of.append(group)
+        
+        # DOIs are resolved up-front in a few batched requests; the per-reference
+        # DOI lookups below are then answered from the response cache
+        dois = [_clean_doi(ref['doi']) for ref in distinct_refs if ref.get('doi')]
+        
+        # Verify all references concurrently over one pooled session, or one by one
+        # with blocking requests when aiohttp is unavailable
+        if aiohttp is not None:
+            if self.session is not None and not self.session.closed:
+                distinct_verifications = await self._verify_concurrently(self.session, distinct_refs, dois)
+            else:
+                connector = aiohttp.TCPConnector(limit=_VERIFY_CONCURRENCY)
+                timeout = aiohttp.ClientTimeout(total=15)
+                async with aiohttp.ClientSession(headers=_CROSSREF_HEADERS, connector=connector, timeout=timeout) as session:
+                    distinct_verifications = await self._verify_concurrently(session, distinct_refs, dois)
+        else:
+            if requests:
+                await self._batch_search_by_doi(dois, None)
+            distinct_verifications = []
+            for i, ref in enumerate(distinct_refs):
+                self.logger.info(f"Verifying paper {i+1}/{len(distinct_refs)}: {ref.get('key', 'unknown')}")
+                distinct_verifications.append(await self._verify_single_paper(ref))
+        
+        for ref, group in zip(references, group_of):
+            verification_result = distinct_verifications[group]
+            if isinstance(verification_result, BaseException):
+                self.logger.error(f"Error verifying {ref.get('key', 'unknown')}: {str(verification_result)}")
+                verification_result = {
+                    'is_valid': False,
+                    'checks_performed': [],
+                    'issues_found': [f'Verification failed: {str(verification_result)}'],
+                    'verified_data': {},
+                    'search_method': None,
+                    'corrections_made': []
+                }
             
             result.verification_results.append({
                 'reference_key': ref.get('key', 'unknown'),
@@ -869,34 +1447,16 @@ class ReferenceValidator(BaseAgent):
             })
             
             if verification_result['is_valid']:
-                # Create corrected reference with verified data
-                corrected_ref = ref.copy()
-                
-                # Apply all verified data corrections
-                if verification_result.get('verified_data'):
-                    verified_data = verification_result['verified_data']
-                    
-                    # Update with verified information
-                    if 'verified_title' in verified_data:
-                        corrected_ref['title'] = verified_data['verified_title']
-                    if 'verified_authors' in verified_data:
-                        corrected_ref['authors'] = verified_data['verified_authors']
-                    if 'verified_journal' in verified_data:
-                        corrected_ref['journal'] = verified_data['verified_journal']
-                    if 'verified_year' in verified_data:
-                        corrected_ref['year'] = verified_data['verified_year']
-                    if 'verified_volume' in verified_data:
-                        corrected_ref['volume'] = verified_data['verified_volume']
-                    if 'verified_issue' in verified_data:
-                        corrected_ref['issue'] = verified_data['verified_issue']
-                    if 'verified_pages' in verified_data:
-                        corrected_ref['pages'] = verified_data['verified_pages']
-                    if 'verified_doi' in verified_data:
-                        corrected_ref['doi'] = verified_data['verified_doi']
-                
-                # Add metadata about verification
-                corrected_ref['verification_method'] = verification_result.get('search_method', 'Unknown')
-                corrected_ref['corrections_applied'] = len(verification_result.get('corrections_made', []))
+                # Create corrected reference with verified data and verification metadata,
+                # built in one go rather than copied and then updated field by field
+                verified_data = verification_result.get('verified_data') or {}
+                corrected_ref = {
+                    **ref,
+                    **{field: verified_data[verified_field]
+                       for verified_field, field in _VERIFIED_FIELD_MAP if verified_field in verified_data},
+                    'verification_method': verification_result.get('search_method', 'Unknown'),
+                    'corrections_applied': len(verification_result.get('corrections_made', []))
+                }
                 
                 verified_refs.append(corrected_ref)
                 
@@ -919,7 +1479,159 @@ class ReferenceValidator(BaseAgent):
         self.logger.info(f"Verification complete: {len(verified_refs)}/{len(references)} papers validated successfully")
         return verified_refs
     
-    async def _verify_single_paper(self, ref: Dict[str, Any]) -> Dict[str, Any]:
+    async def _verify_concurrently(self, session: Any, references: List[Dict[str, Any]], dois: List[str]) -> List[Any]:
+        """Batch-resolve DOIs, then verify every reference at once (exceptions are returned, not raised)."""
+        await self._batch_search_by_doi(dois, session)
+        semaphore = asyncio.Semaphore(_VERIFY_CONCURRENCY)
+        return await asyncio.gather(
+            *[self._verify_limited(session, semaphore, i, ref, len(references)) for i, ref in enumerate(references)],
+            return_exceptions=True
+        )
+    
+    async def _verify_limited(self, session: Any, semaphore: asyncio.Semaphore, index: int, ref: Dict[str, Any], total: int) -> Dict[str, Any]:
+        """Verify one reference while holding a slot of the shared concurrency limit."""
+        async with semaphore:
+            self.logger.info(f"Verifying paper {index+1}/{total}: {ref.get('key', 'unknown')}")
+            return await self._verify_single_paper(ref, session)
+    
+    async def _crossref_get(self, session: Any, url: str, params: Optional[Dict[str, Any]] = None,
+                            cache_key: Optional[str] = None) -> Tuple[int, Optional[Dict]]:
+        """
+        GET a CrossRef endpoint and return (status, JSON body or None).
+        
+        Uses the given aiohttp session, or blocking requests when session is None.
+        With a cache_key, 200 and 404 responses are memoized in memory and on
+        disk, so re-verifying a DOI or title - in this run or a later one - is free.
+        """
+        if cache_key is None:
+            return await self._crossref_fetch(session, url, params, None)
+        
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Join a request for the same DOI/title another task already has in flight
+        pending = self._crossref_pending.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._crossref_fetch(session, url, params, cache_key))
+            self._crossref_pending[cache_key] = pending
+            pending.add_done_callback(lambda _: self._crossref_pending.pop(cache_key, None))
+        return await asyncio.shield(pending)
+    
+    async def _crossref_fetch(self, session: Any, url: str, params: Optional[Dict[str, Any]],
+                              cache_key: Optional[str]) -> Tuple[int, Optional[Dict]]:
+        """Perform one CrossRef GET for _crossref_get, storing definitive answers under cache_key."""
+        await self._crossref_limiter.acquire()
+        if session is not None:
+            async with session.get(url, params=params, headers=_CROSSREF_HEADERS) as response:
+                status = response.status
+                data = _load_crossref_json(await response.read()) if status == 200 else None
+        else:
+            response = self._get_requests_session().get(url, params=params, timeout=15)
+            status = response.status_code
+            data = _load_crossref_json(response.content) if status == 200 else None
+        
+        # Drop everything verification does not read (reference lists, funders, ...) before caching
+        if data is not None:
+            data = _slim_crossref_body(data)
+        
+        if cache_key is not None and status in (200, 404):
+            self._remember_response(cache_key, status, data)
+            if self._response_cache:
+                self._response_cache.set(
+                    cache_key, [status, data],
+                    ttl=_NEGATIVE_CACHE_TTL if status == 404 else None
+                )
+        
+        return status, data
+    
+    def _get_requests_session(self):
+        """Return the keep-alive requests session used when aiohttp is unavailable, creating it on first use."""
+        if self._requests_session is None:
+            session = requests.Session()
+            session.headers.update(_CROSSREF_HEADERS)
+            adapter = HTTPAdapter(pool_connections=_VERIFY_CONCURRENCY, pool_maxsize=_VERIFY_CONCURRENCY)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._requests_session = session
+        return self._requests_session
+    
+    def _cached_response(self, cache_key: str) -> Optional[Tuple[int, Optional[Dict]]]:
+        """Return a remembered (status, body) from memory or the disk cache, or None."""
+        cached = self._crossref_responses.get(cache_key)
+        if cached is not None:
+            self._crossref_responses.move_to_end(cache_key)
+            return cached
+        
+        stored = self._response_cache.get(cache_key) if self._response_cache else None
+        if stored is None:
+            return None
+        self._remember_response(cache_key, stored[0], stored[1])
+        return stored[0], stored[1]
+    
+    def _remember_response(self, cache_key: str, status: int, data: Optional[Dict]) -> None:
+        """Store a definitive CrossRef response, evicting the least recently used beyond the size limit."""
+        self._crossref_responses[cache_key] = (status, data)
+        self._crossref_responses.move_to_end(cache_key)
+        if len(self._crossref_responses) > _CROSSREF_RESPONSE_CACHE_SIZE:
+            self._crossref_responses.popitem(last=False)
+    
+    async def _batch_search_by_doi(self, dois: List[str], session: Any = None) -> Dict[str, Dict]:
+        """
+        Resolve cleaned DOIs with CrossRef's filter=doi: query, many DOIs per request.
+        
+        Each answer is stored in the response caches as if the DOI had been fetched
+        on its own (found: 200, absent from a successful batch: 404), so
+        _search_by_doi then needs no request. DOIs already cached, in memory or
+        on disk, are not re-queried; DOIs from failed batches are left uncached
+        for the per-DOI path to retry.
+        
+        Returns:
+            Dict mapping DOI -> CrossRef work for the DOIs that were found
+        """
+        found = {}
+        pending = [
+            doi for doi in dict.fromkeys(dois)
+            if self._cached_response(f"doi:{doi}") is None
+        ]
+        
+        for start in range(0, len(pending), _CROSSREF_DOI_BATCH_SIZE):
+            chunk = pending[start:start + _CROSSREF_DOI_BATCH_SIZE]
+            params = {
+                'filter': ','.join(f"doi:{doi}" for doi in chunk),
+                'rows': len(chunk),
+                'select': _CROSSREF_SELECT
+            }
+            
+            try:
+                self.logger.info(f"Searching {len(chunk)} papers by DOI in one CrossRef request")
+                status, data = await self._crossref_get(session, _CROSSREF_WORKS_URL, params)
+            except Exception as e:
+                self.logger.warning(f"Batched DOI search failed, falling back to per-DOI lookups: {str(e)}")
+                continue
+            
+            if status != 200:
+                self.logger.warning(f"CrossRef API error for DOI batch: {status}")
+                continue
+            
+            for work in data.get('message', {}).get('items', []):
+                if work.get('DOI'):
+                    found[work['DOI'].lower()] = work
+            hits, misses = {}, {}
+            for doi in chunk:
+                if doi in found:
+                    self._remember_response(f"doi:{doi}", 200, {'message': found[doi]})
+                    hits[f"doi:{doi}"] = [200, {'message': found[doi]}]
+                else:
+                    self._remember_response(f"doi:{doi}", 404, None)
+                    misses[f"doi:{doi}"] = [404, None]
+            if self._response_cache:
+                self._response_cache.set_many(hits)
+                self._response_cache.set_many(misses, ttl=_NEGATIVE_CACHE_TTL)
+        
+        return found
+    
+    async def _verify_single_paper(self, ref: Dict[str, Any], session: Any = None) -> Dict[str, Any]:
         """Verify a single paper using CrossRef API with comprehensive validation."""
         verification = {
             'is_valid': False,
@@ -933,12 +1645,12 @@ class ReferenceValidator(BaseAgent):
         crossref_data = None
         
         # Step 1: Try to find paper by DOI first
-        if 'doi' in ref and ref['doi'] and requests:
-            crossref_data = await self._search_by_doi(ref['doi'], verification)
+        if 'doi' in ref and ref['doi'] and (session is not None or requests):
+            crossref_data = await self._search_by_doi(ref['doi'], verification, session)
         
         # Step 2: If DOI search failed, try title search
         if not crossref_data and 'title' in ref and ref['title']:
-            crossref_data = await self._search_by_title(ref['title'], verification)
+            crossref_data = await self._search_by_title(ref['title'], verification, session)
         
         # Step 3: If paper found, validate and correct all information
         if crossref_data:
@@ -949,44 +1661,29 @@ class ReferenceValidator(BaseAgent):
         
         return verification
     
-    async def _search_by_doi(self, doi: str, verification: Dict) -> Dict:
+    async def _search_by_doi(self, doi: str, verification: Dict, session: Any = None) -> Dict:
         """Search for paper by DOI."""
         try:
-            # Clean DOI
-            clean_doi = doi.strip()
-            if clean_doi.startswith('https://doi.org/'):
-                clean_doi = clean_doi.replace('https://doi.org/', '')
-            elif clean_doi.startswith('http://dx.doi.org/'):
-                clean_doi = clean_doi.replace('http://dx.doi.org/', '')
-            elif clean_doi.startswith('doi:'):
-                clean_doi = clean_doi.replace('doi:', '')
+            clean_doi = _clean_doi(doi)
             
             # Query CrossRef API
-            crossref_url = f"https://api.crossref.org/works/{clean_doi}"
-            headers = {
-                'User-Agent': 'Research System/1.0 (mailto:research@example.com)',
-                'Accept': 'application/json'
-            }
-            
             self.logger.info(f"Searching paper by DOI: {clean_doi}")
-            response = requests.get(crossref_url, headers=headers, timeout=15)
+            status, data = await self._crossref_get(
+                session, f"{_CROSSREF_WORKS_URL}/{clean_doi}", cache_key=f"doi:{clean_doi}"
+            )
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 work = data.get('message', {})
                 verification['checks_performed'].append('DOI verification successful')
                 verification['search_method'] = 'DOI'
                 self.logger.info(f"Paper found by DOI: {work.get('title', ['Unknown'])[0] if work.get('title') else 'Unknown'}")
                 return work
-            elif response.status_code == 404:
+            elif status == 404:
                 verification['issues_found'].append('DOI not found in CrossRef')
                 self.logger.warning(f"DOI not found: {clean_doi}")
             else:
-                verification['issues_found'].append(f'CrossRef API error for DOI: {response.status_code}')
-                self.logger.warning(f"CrossRef API error for DOI {clean_doi}: {response.status_code}")
-            
-            # Small delay for API rate limiting
-            await asyncio.sleep(0.2)
+                verification['issues_found'].append(f'CrossRef API error for DOI: {status}')
+                self.logger.warning(f"CrossRef API error for DOI {clean_doi}: {status}")
             
         except Exception as e:
             verification['issues_found'].append(f'DOI search failed: {str(e)}')
@@ -994,70 +1691,47 @@ class ReferenceValidator(BaseAgent):
         
         return None
     
-    async def _search_by_title(self, title: str, verification: Dict) -> Dict:
+    async def _search_by_title(self, title: str, verification: Dict, session: Any = None) -> Dict:
         """Search for paper by title using CrossRef API with improved matching."""
         try:
-            # Clean and prepare title for search
-            clean_title = title.strip()
-            # Remove common academic formatting
-            clean_title = re.sub(r'[^\w\s]', ' ', clean_title)
-            clean_title = ' '.join(clean_title.split())  # Normalize whitespace
-            
-            # Try multiple search strategies
-            search_queries = [
+            # Clean and prepare title for search: remove common academic formatting,
+            # then normalize whitespace with the same split the queries are cut from
+            title_words = _NONWORD_RE.sub(' ', title).split()
+            clean_title = ' '.join(title_words)
+            
+            # Try multiple search strategies, each distinct query once: for titles of
+            # up to 10 (or 6) words the shortened queries equal the full title
+            search_queries = dict.fromkeys([
                 clean_title,  # Full title
-                ' '.join(clean_title.split()[:10]),  # First 10 words
-                ' '.join(clean_title.split()[:6]),   # First 6 words
-            ]
+                ' '.join(title_words[:10]),  # First 10 words
+                ' '.join(title_words[:6]),   # First 6 words
+            ])
             
+            # The first query with an acceptable match wins; shorter ones are only fallbacks
             for query in search_queries:
                 if len(query.strip()) < 10:  # Skip very short queries
                     continue
                     
                 # Query CrossRef API with title search
-                search_url = "https://api.crossref.org/works"
                 params = {
                     'query.title': query,
                     'rows': 10,  # Get more results for better matching
-                    'sort': 'relevance'
-                }
-                headers = {
-                    'User-Agent': 'Research System/1.0 (mailto:research@example.com)',
-                    'Accept': 'application/json'
+                    'sort': 'relevance',
+                    'select': _CROSSREF_SELECT
                 }
                 
                 self.logger.info(f"Searching paper by title: {query[:50]}...")
-                response = requests.get(search_url, params=params, headers=headers, timeout=15)
+                title_key = hashlib.blake2b(query.lower().encode(), digest_size=16).hexdigest()
+                status, data = await self._crossref_get(
+                    session, _CROSSREF_WORKS_URL, params, cache_key=f"title:{title_key}"
+                )
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if status == 200:
                     items = data.get('message', {}).get('items', [])
                     
                     if items:
                         # Find best match by title similarity
-                        best_match = None
-                        best_similarity = 0
-                        
-                        for item in items:
-                            if 'title' in item and item['title']:
-                                crossref_title = item['title'][0] if isinstance(item['title'], list) else item['title']
-                                
-                                # Calculate similarity with original title
-                                similarity = difflib.SequenceMatcher(None, 
-                                                                   clean_title.lower(), 
-                                                                   crossref_title.lower()).ratio()
-                                
-                                # Also check word overlap
-                                title_words = set(clean_title.lower().split())
-                                crossref_words = set(crossref_title.lower().split())
-                                word_overlap = len(title_words.intersection(crossref_words)) / max(len(title_words), len(crossref_words))
-                                
-                                # Combined score (similarity + word overlap)
-                                combined_score = (similarity * 0.7) + (word_overlap * 0.3)
-                                
-                                if combined_score > best_similarity and combined_score > 0.5:  # Lower threshold
-                                    best_similarity = combined_score
-                                    best_match = item
+                        best_match, best_similarity = _best_title_match(clean_title, items)
                         
                         if best_match:
                             verification['checks_performed'].append(f'Title search successful (similarity: {best_similarity:.2f})')
@@ -1065,9 +1739,6 @@ class ReferenceValidator(BaseAgent):
                             crossref_title = best_match['title'][0] if isinstance(best_match['title'], list) else best_match['title']
                             self.logger.info(f"Paper found by title: {crossref_title}")
                             return best_match
-                
-                # Small delay between queries
-                await asyncio.sleep(0.3)
             
             verification['issues_found'].append('No similar titles found in search results')
             self.logger.warning(f"No similar titles found for: {title}")
@@ -1107,9 +1778,9 @@ class ReferenceValidator(BaseAgent):
             verified_data['verified_title'] = crossref_title
             
             if 'title' in ref and ref['title']:
-                similarity = difflib.SequenceMatcher(None, 
-                                                   ref['title'].lower(), 
-                                                   crossref_title.lower()).ratio()
+                ref_title_lower = ref['title'].lower()
+                crossref_title_lower = crossref_title.lower()
+                similarity = 1.0 if ref_title_lower == crossref_title_lower else _text_similarity(ref_title_lower, crossref_title_lower)
                 if similarity < 0.9:  # If less than 90% similar, it's a correction
                     corrections.append(f"Title corrected: '{ref['title']}' → '{crossref_title}'")
             else:
@@ -1153,52 +1824,25 @@ class ReferenceValidator(BaseAgent):
             verified_data['verified_year'] = crossref_year
             
             if 'year' in ref and ref['year']:
-                if int(ref['year']) != crossref_year and crossref_year > int(ref['year']):
+                if crossref_year > int(ref['year']):
                     corrections.append(f"Year updated to more recent: {ref['year']} → {crossref_year}")
             else:
                 corrections.append(f"Year added: {crossref_year}")
         
-        # Validate and correct volume
-        if 'volume' in crossref_data and crossref_data['volume']:
-            crossref_volume = str(crossref_data['volume']).strip()
-            verified_data['verified_volume'] = crossref_volume
-            
-            if 'volume' in ref and ref['volume']:
-                if str(ref['volume']).strip() != crossref_volume:
-                    corrections.append(f"Volume corrected: {ref['volume']} → {crossref_volume}")
-            else:
-                corrections.append(f"Volume added: {crossref_volume}")
-        
-        # Validate and correct issue
-        if 'issue' in crossref_data and crossref_data['issue']:
-            crossref_issue = str(crossref_data['issue']).strip()
-            verified_data['verified_issue'] = crossref_issue
-            
-            if 'issue' in ref and ref['issue']:
-                if str(ref['issue']).strip() != crossref_issue:
-                    corrections.append(f"Issue corrected: {ref['issue']} → {crossref_issue}")
-            else:
-                corrections.append(f"Issue added: {crossref_issue}")
-        
-        # Validate and correct pages/article number
-        if 'page' in crossref_data and crossref_data['page']:
-            crossref_pages = str(crossref_data['page']).strip()
-            verified_data['verified_pages'] = crossref_pages
-            
-            if 'pages' in ref and ref['pages']:
-                if str(ref['pages']).strip() != crossref_pages:
-                    corrections.append(f"Pages corrected: {ref['pages']} → {crossref_pages}")
-            else:
-                corrections.append(f"Pages added: {crossref_pages}")
-        elif 'article-number' in crossref_data and crossref_data['article-number']:
-            crossref_article = str(crossref_data['article-number']).strip()
-            verified_data['verified_pages'] = crossref_article
+        # Validate and correct volume, issue and pages/article number
+        for crossref_field, field, label in _CROSSREF_NUMBERING_FIELDS:
+            verified_field = f"verified_{field}"
+            # An article number only stands in for missing pages
+            if verified_field in verified_data or not crossref_data.get(crossref_field):
+                continue
+            crossref_value = str(crossref_data[crossref_field]).strip()
+            verified_data[verified_field] = crossref_value
             
-            if 'pages' in ref and ref['pages']:
-                if str(ref['pages']).strip() != crossref_article:
-                    corrections.append(f"Article number corrected: {ref['pages']} → {crossref_article}")
+            if field in ref and ref[field]:
+                if str(ref[field]).strip() != crossref_value:
+                    corrections.append(f"{label} corrected: {ref[field]} → {crossref_value}")
             else:
-                corrections.append(f"Article number added: {crossref_article}")
+                corrections.append(f"{label} added: {crossref_value}")
         
         # Add DOI if should update
         if should_update_doi and 'DOI' in crossref_data and crossref_data['DOI']:
@@ -1206,8 +1850,7 @@ class ReferenceValidator(BaseAgent):
             verified_data['verified_doi'] = f"https://doi.org/{crossref_doi}"
             
             if 'doi' in ref and ref['doi']:
-                ref_doi = ref['doi'].replace('https://doi.org/', '').replace('http://dx.doi.org/', '')
-                if ref_doi != crossref_doi:
+                if _clean_doi(ref['doi']) != crossref_doi.lower():
                     corrections.append(f"DOI updated: {ref['doi']} → https://doi.org/{crossref_doi}")
             else:
                 corrections.append(f"DOI added: https://doi.org/{crossref_doi}")
@@ -1231,274 +1874,194 @@ class ReferenceValidator(BaseAgent):
     
     def _generate_bibitem_format(self, references: List[Dict[str, Any]]) -> str:
         """Generate references in bibitem format with verified data."""
-        output_lines = []
+        out = io.StringIO()
         
-        for ref in references:
-            # Generate bibitem key
-            key = ref.get('key', 'unknown')
-            
-            # Build citation with verified/corrected data
-            parts = []
-            
-            # Authors (use verified data if available)
-            authors = ref.get('authors', 'Unknown Author')
-            parts.append(authors)
-            
-            # Title (use verified data if available)
-            title = ref.get('title', 'Unknown Title')
-            parts.append(title)
+        for i, ref in enumerate(references):
+            if i:
+                out.write('\n\n')
             
-            # Journal (use verified data if available)
-            journal = ref.get('journal', 'Unknown Journal')
+            # Authors, title and journal (use verified data if available), comma separated
+            out.write(f"\\bibitem{{{ref.get('key', 'unknown')}}} ")
+            out.write(f"{ref.get('authors', 'Unknown Author')}, {ref.get('title', 'Unknown Title')}, ")
+            out.write(ref.get('journal', 'Unknown Journal'))
             
             # Volume and issue (use verified data if available)
             volume = ref.get('volume')
-            issue = ref.get('issue')
-            
-            journal_part = journal
             if volume:
-                if issue:
-                    journal_part += f" \\textbf{{{volume}}}({issue})"
-                else:
-                    journal_part += f" \\textbf{{{volume}}}"
-            
-            parts.append(journal_part)
-            
-            # Year (use verified data if available)
-            year = ref.get('year', 'Unknown Year')
-            parts.append(f"({year})")
+                issue = ref.get('issue')
+                out.write(f" \\textbf{{{volume}}}({issue})" if issue else f" \\textbf{{{volume}}}")
             
-            # Pages (use verified data if available)
+            # Year and pages (use verified data if available)
+            out.write(f" ({ref.get('year', 'Unknown Year')})")
             pages = ref.get('pages')
             if pages:
-                parts.append(pages)
-            
-            # Combine parts
-            citation = f"\\bibitem{{{key}}} {', '.join(parts[:3])}"
-            if len(parts) > 3:
-                citation += f" {' '.join(parts[3:])}"
+                out.write(f" {pages}")
             
             # Add DOI (use verified data if available)
             doi = ref.get('doi')
             if doi:
-                if not doi.startswith('http'):
-                    doi = f"https://doi.org/{doi}"
-                citation += f". {doi}"
-            
-            output_lines.append(citation)
+                out.write(f". {doi}" if doi.startswith('http') else f". https://doi.org/{doi}")
         
-        return '\n\n'.join(output_lines)
+        return out.getvalue()
     
     def _generate_bibtex_format(self, references: List[Dict[str, Any]]) -> str:
         """Generate references in BibTeX format with verified data."""
-        output_lines = []
+        out = io.StringIO()
         
-        for ref in references:
-            key = ref.get('key', 'unknown')
-            entry_type = ref.get('entry_type', 'article')
-            
-            lines = [f"@{entry_type}{{{key},"]
+        for i, ref in enumerate(references):
+            if i:
+                out.write('\n\n')
+            out.write(f"@{ref.get('entry_type', 'article')}{{{ref.get('key', 'unknown')},\n")
             
             # Add fields (use verified/corrected data)
-            if 'authors' in ref:
-                lines.append(f"  author = {{{ref['authors']}}},")
-            
-            if 'title' in ref:
-                lines.append(f"  title = {{{ref['title']}}},")
-            
-            if 'journal' in ref:
-                lines.append(f"  journal = {{{ref['journal']}}},")
-            
-            if 'year' in ref:
-                lines.append(f"  year = {{{ref['year']}}},")
-            
-            if 'volume' in ref:
-                lines.append(f"  volume = {{{ref['volume']}}},")
-            
-            if 'issue' in ref:
-                lines.append(f"  number = {{{ref['issue']}}},")
-            
-            if 'pages' in ref:
-                lines.append(f"  pages = {{{ref['pages']}}},")
+            for field, bibtex_field in _BIBTEX_OUTPUT_FIELDS:
+                if field in ref:
+                    out.write(f"  {bibtex_field} = {{{ref[field]}}},\n")
             
             if 'doi' in ref:
                 doi = ref['doi'].replace('https://doi.org/', '').replace('http://dx.doi.org/', '')
-                lines.append(f"  doi = {{{doi}}},")
+                out.write(f"  doi = {{{doi}}},\n")
             
-            lines.append("}")
-            output_lines.append('\n'.join(lines))
+            out.write("}")
         
-        return '\n\n'.join(output_lines)
+        return out.getvalue()
     
     def _generate_plain_format(self, references: List[Dict[str, Any]]) -> str:
         """Generate references in plain text format with verified data."""
-        output_lines = []
+        out = io.StringIO()
         
         for i, ref in enumerate(references, 1):
-            # Build plain citation with verified/corrected data
-            authors = ref.get('authors', 'Unknown Author')
-            title = ref.get('title', 'Unknown Title')
-            journal = ref.get('journal', 'Unknown Journal')
-            year = ref.get('year', 'Unknown Year')
+            if i > 1:
+                out.write('\n\n')
             
-            citation = f"{i}. {authors}. {title}. {journal}"
+            # Build plain citation with verified/corrected data
+            out.write(
+                f"{i}. {ref.get('authors', 'Unknown Author')}. {ref.get('title', 'Unknown Title')}. "
+                f"{ref.get('journal', 'Unknown Journal')}"
+            )
             
             volume = ref.get('volume')
-            issue = ref.get('issue')
-            
             if volume:
-                if issue:
-                    citation += f" {volume}({issue})"
-                else:
-                    citation += f" {volume}"
+                issue = ref.get('issue')
+                out.write(f" {volume}({issue})" if issue else f" {volume}")
             
-            citation += f" ({year})"
+            out.write(f" ({ref.get('year', 'Unknown Year')})")
             
             pages = ref.get('pages')
             if pages:
-                citation += f": {pages}"
+                out.write(f": {pages}")
             
             doi = ref.get('doi')
             if doi:
-                if not doi.startswith('http'):
-                    doi = f"https://doi.org/{doi}"
-                citation += f". {doi}"
-            
-            output_lines.append(citation)
+                out.write(f". {doi}" if doi.startswith('http') else f". https://doi.org/{doi}")
         
-        return '\n\n'.join(output_lines)
+        return out.getvalue()
     
     def generate_validation_report(self, result: ReferenceValidationResult) -> str:
         """Generate a comprehensive validation report with detailed corrections."""
-        report_lines = []
-        
-        report_lines.append("# Reference Validation Report")
-        report_lines.append("=" * 50)
-        report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("")
-        
-        # Summary
-        report_lines.append("## Summary")
-        report_lines.append(f"- Original references: {result.original_count}")
-        report_lines.append(f"- Duplicates removed: {len(result.duplicates_removed)}")
-        report_lines.append(f"- Format corrections: {len(result.format_corrections)}")
-        report_lines.append(f"- Spelling corrections: {len(result.spelling_corrections)}")
-        report_lines.append(f"- Invalid papers found: {len(result.invalid_papers)}")
-        report_lines.append(f"- Final valid references: {result.final_count}")
-        
         # Calculate total corrections made
-        total_corrections = 0
-        for verification in result.verification_results:
-            if verification['verification'].get('corrections_made'):
-                total_corrections += len(verification['verification']['corrections_made'])
-        
-        report_lines.append(f"- Total data corrections: {total_corrections}")
-        report_lines.append("")
+        total_corrections = sum(
+            len(verification['verification'].get('corrections_made') or ())
+            for verification in result.verification_results
+        )
+        
+        report_lines = [
+            "# Reference Validation Report",
+            "=" * 50,
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+            # Summary
+            "## Summary",
+            f"- Original references: {result.original_count}",
+            f"- Duplicates removed: {len(result.duplicates_removed)}",
+            f"- Format corrections: {len(result.format_corrections)}",
+            f"- Spelling corrections: {len(result.spelling_corrections)}",
+            f"- Invalid papers found: {len(result.invalid_papers)}",
+            f"- Final valid references: {result.final_count}",
+            f"- Total data corrections: {total_corrections}",
+            "",
+            # Processing log
+            "## Processing Log",
+        ]
+        add = report_lines.append
+        extend = report_lines.extend
         
-        # Processing log
-        report_lines.append("## Processing Log")
-        for log_entry in result.processing_log:
-            report_lines.append(f"- {log_entry}")
-        report_lines.append("")
+        extend(f"- {log_entry}" for log_entry in result.processing_log)
+        add("")
         
         # Duplicates removed
         if result.duplicates_removed:
-            report_lines.append("## Duplicates Removed")
+            add("## Duplicates Removed")
             for i, dup in enumerate(result.duplicates_removed, 1):
-                report_lines.append(f"{i}. Key: {dup['reference'].get('key', 'unknown')}")
-                report_lines.append(f"   Reason: {dup['reason']}")
+                add(f"{i}. Key: {dup['reference'].get('key', 'unknown')}")
+                add(f"   Reason: {dup['reason']}")
                 if 'similarity_score' in dup:
-                    report_lines.append(f"   Similarity Score: {dup['similarity_score']:.2f}")
-                report_lines.append("")
-        
-        # Format corrections
-        if result.format_corrections:
-            report_lines.append("## Format Corrections")
-            for i, correction in enumerate(result.format_corrections, 1):
-                report_lines.append(f"{i}. Reference: {correction['reference_key']}")
-                for corr in correction['corrections']:
-                    report_lines.append(f"   - {corr}")
-                report_lines.append("")
-        
-        # Spelling corrections
-        if result.spelling_corrections:
-            report_lines.append("## Spelling Corrections")
-            for i, correction in enumerate(result.spelling_corrections, 1):
-                report_lines.append(f"{i}. Reference: {correction['reference_key']}")
-                for corr in correction['corrections']:
-                    report_lines.append(f"   - {corr}")
-                report_lines.append("")
+                    add(f"   Similarity Score: {dup['similarity_score']:.2f}")
+                add("")
+        
+        # Format and spelling corrections
+        for heading, corrections in (("## Format Corrections", result.format_corrections),
+                                     ("## Spelling Corrections", result.spelling_corrections)):
+            if corrections:
+                add(heading)
+                for i, correction in enumerate(corrections, 1):
+                    add(f"{i}. Reference: {correction['reference_key']}")
+                    extend(f"   - {corr}" for corr in correction['corrections'])
+                    add("")
         
         # Paper verification and data corrections
         if result.verification_results:
-            report_lines.append("## Paper Verification and Data Corrections")
+            add("## Paper Verification and Data Corrections")
             for i, verification in enumerate(result.verification_results, 1):
-                report_lines.append(f"{i}. Reference: {verification['reference_key']}")
-                
                 ver_result = verification['verification']
-                report_lines.append(f"   Status: {'✅ Valid' if ver_result['is_valid'] else '❌ Invalid'}")
+                add(f"{i}. Reference: {verification['reference_key']}")
+                add(f"   Status: {'✅ Valid' if ver_result['is_valid'] else '❌ Invalid'}")
                 
                 if ver_result.get('search_method'):
-                    report_lines.append(f"   Search Method: {ver_result['search_method']}")
+                    add(f"   Search Method: {ver_result['search_method']}")
                 
-                if ver_result.get('checks_performed'):
-                    report_lines.append("   Checks Performed:")
-                    for check in ver_result['checks_performed']:
-                        report_lines.append(f"   - {check}")
+                for field, title in _REPORT_VERIFICATION_LISTS:
+                    if ver_result.get(field):
+                        add(title)
+                        extend(f"   - {entry}" for entry in ver_result[field])
                 
-                if ver_result.get('corrections_made'):
-                    report_lines.append("   Data Corrections Made:")
-                    for correction in ver_result['corrections_made']:
-                        report_lines.append(f"   - {correction}")
-                
-                if ver_result.get('issues_found'):
-                    report_lines.append("   Issues Found:")
-                    for issue in ver_result['issues_found']:
-                        report_lines.append(f"   - {issue}")
-                
-                report_lines.append("")
+                add("")
         
         # Invalid papers
         if result.invalid_papers:
-            report_lines.append("## Invalid Papers")
+            add("## Invalid Papers")
             for i, invalid in enumerate(result.invalid_papers, 1):
-                report_lines.append(f"{i}. Key: {invalid['reference'].get('key', 'unknown')}")
-                report_lines.append(f"   Reason: {invalid['reason']}")
+                add(f"{i}. Key: {invalid['reference'].get('key', 'unknown')}")
+                add(f"   Reason: {invalid['reason']}")
                 if 'search_attempts' in invalid:
-                    report_lines.append(f"   Search Attempts: {', '.join(invalid['search_attempts'])}")
-                report_lines.append("")
+                    add(f"   Search Attempts: {', '.join(invalid['search_attempts'])}")
+                add("")
         
         # Validation statistics
-        report_lines.append("## Validation Statistics")
+        add("## Validation Statistics")
         
         # Search method breakdown
-        search_methods = {}
-        for verification in result.verification_results:
-            method = verification['verification'].get('search_method', 'Unknown')
-            search_methods[method] = search_methods.get(method, 0) + 1
-        
+        search_methods = Counter(
+            verification['verification'].get('search_method', 'Unknown')
+            for verification in result.verification_results
+        )
         if search_methods:
-            report_lines.append("### Paper Discovery Methods:")
-            for method, count in search_methods.items():
-                report_lines.append(f"- {method}: {count} papers")
-            report_lines.append("")
+            add("### Paper Discovery Methods:")
+            extend(f"- {method}: {count} papers" for method, count in search_methods.items())
+            add("")
         
         # Correction type breakdown
-        correction_types = {}
+        correction_types = Counter()
         for verification in result.verification_results:
-            corrections = verification['verification'].get('corrections_made', [])
-            for correction in corrections:
+            for correction in verification['verification'].get('corrections_made', []):
                 if 'corrected:' in correction:
-                    field = correction.split(' corrected:')[0]
-                    correction_types[field] = correction_types.get(field, 0) + 1
+                    correction_types[correction.split(' corrected:')[0]] += 1
                 elif 'added:' in correction:
-                    field = correction.split(' added:')[0]
-                    correction_types[f"{field} (added)"] = correction_types.get(f"{field} (added)", 0) + 1
+                    correction_types[f"{correction.split(' added:')[0]} (added)"] += 1
         
         if correction_types:
-            report_lines.append("### Data Correction Breakdown:")
-            for correction_type, count in sorted(correction_types.items()):
-                report_lines.append(f"- {correction_type}: {count} corrections")
-            report_lines.append("")
+            add("### Data Correction Breakdown:")
+            extend(f"- {correction_type}: {count} corrections" for correction_type, count in sorted(correction_types.items()))
+            add("")
         
         return '\n'.join(report_lines)
\ No newline at end of file
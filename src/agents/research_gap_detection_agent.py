@@ -1,14 +1,86 @@
 """
 Research Gap Detection Agent - Identifies unexplored research areas and opportunities.
 """
-from typing import List, Dict, Any, Set
-from collections import Counter, defaultdict
+from typing import List, Dict, Any, Iterable, Optional, Set
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 import re
 
+# Optional Aho-Corasick automaton for single-pass term matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Vectorized priority bucketing when numpy is installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from ..models.data_models import TopicMap, Claim, ResearchGap
 from .base_agent import BaseAgent
 
 
+# Topic words that raise a coverage gap's priority (simplified notion of importance)
+_IMPORTANCE_KEYWORDS = frozenset([
+    "neural", "deep", "learning", "optimization", "evaluation",
+    "performance", "accuracy", "efficiency"
+])
+
+
+def _lowered_terms(terms: List[str]) -> Dict[str, str]:
+    """Map each distinct term to its lowercase form, so every term is lowercased once."""
+    return {term: term.lower() for term in terms}
+
+
+def _count_statements_containing(terms: Iterable[str], statements: List[str]) -> Counter:
+    """
+    Count, for each term, the statements that contain it.
+    
+    Terms and statements must already be lowercased. With pyahocorasick every
+    statement is scanned once for all terms; otherwise each term is searched
+    for in turn.
+    """
+    distinct_terms = set(terms)
+    counts = Counter()
+    
+    # The empty string is in every statement (and cannot go in an automaton)
+    if '' in distinct_terms:
+        distinct_terms.discard('')
+        counts[''] = len(statements)
+    
+    if ahocorasick is not None and distinct_terms:
+        automaton = ahocorasick.Automaton()
+        for term in distinct_terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        for statement in statements:
+            counts.update({term for _, term in automaton.iter(statement)})
+    else:
+        for term in distinct_terms:
+            counts[term] = sum(1 for statement in statements if term in statement)
+    
+    return counts
+
+
+@lru_cache(maxsize=1024)
+def _gap_priority(topic: str, current_count: int, expected_count: int) -> float:
+    """Priority score for a coverage gap; cached since topics recur within a run."""
+    
+    # Base priority on how far below expected the current count is
+    deficit_ratio = (expected_count - current_count) / expected_count
+    base_priority = min(deficit_ratio, 1.0)
+    
+    # Adjust based on topic importance
+    topic_lower = topic.lower()
+    importance_boost = sum(0.1 for keyword in _IMPORTANCE_KEYWORDS if keyword in topic_lower)
+    
+    return min(base_priority + importance_boost, 1.0)
+
+
 class ResearchGapDetectionAgent(BaseAgent):
     """Agent responsible for identifying research gaps and opportunities."""
     
@@ -56,11 +128,19 @@ class ResearchGapDetectionAgent(BaseAgent):
         
         gaps = []
         
+        # Lowercase every claim statement once for all term-matching detectors
+        lowered_statements = [claim.statement.lower() for claim in claims]
+        
+        # Count the terms of every detector in a single pass over the statements
+        term_counts = _count_statements_containing(
+            self._detector_terms(topic_map), lowered_statements
+        )
+        
         # Detect different types of gaps
-        coverage_gaps = await self._detect_coverage_gaps(topic_map, claims)
+        coverage_gaps = await self._detect_coverage_gaps(topic_map, claims, lowered_statements, term_counts)
         gaps.extend(coverage_gaps)
         
-        methodological_gaps = await self._detect_methodological_gaps(claims)
+        methodological_gaps = await self._detect_methodological_gaps(claims, lowered_statements, term_counts)
         gaps.extend(methodological_gaps)
         
         dataset_gaps = await self._detect_dataset_gaps(topic_map, claims)
@@ -69,7 +149,7 @@ class ResearchGapDetectionAgent(BaseAgent):
         temporal_gaps = await self._detect_temporal_gaps(claims)
         gaps.extend(temporal_gaps)
         
-        evaluation_gaps = await self._detect_evaluation_gaps(claims)
+        evaluation_gaps = await self._detect_evaluation_gaps(claims, lowered_statements, term_counts)
         gaps.extend(evaluation_gaps)
         
         # Rank gaps by priority
@@ -87,21 +167,41 @@ class ResearchGapDetectionAgent(BaseAgent):
         
         return ranked_gaps
     
-    async def _detect_coverage_gaps(self, topic_map: TopicMap, claims: List[Claim]) -> List[ResearchGap]:
-        """Detect gaps in topic coverage."""
-        gaps = []
+    def _detector_terms(self, topic_map: TopicMap) -> Iterable[str]:
+        """Yield the lowercased terms searched for by the coverage, methodology and evaluation detectors."""
+        for terms in (topic_map.subtopics, topic_map.methods,
+                      self.gap_detection_rules["methodological_gaps"],
+                      self.gap_detection_rules["evaluation_gaps"]):
+            yield from _lowered_terms(terms).values()
+    
+    async def _detect_coverage_gaps(self, topic_map: TopicMap, claims: List[Claim],
+                                    lowered_statements: Optional[List[str]] = None,
+                                    term_counts: Optional[Counter] = None) -> List[ResearchGap]:
+        """
+        Detect gaps in topic coverage.
         
-        # Analyze subtopic coverage
-        subtopic_claims = defaultdict(list)
-        for claim in claims:
-            for subtopic in topic_map.subtopics:
-                if subtopic.lower() in claim.statement.lower():
-                    subtopic_claims[subtopic].append(claim)
+        lowered_statements are the claims' statements, lowercased; term_counts maps
+        lowercased terms to the number of statements containing them.
+        """
+        gaps = []
+        if lowered_statements is None:
+            lowered_statements = [claim.statement.lower() for claim in claims]
+        
+        # Count claims mentioning each subtopic and method in one pass over the statements;
+        # a term listed twice counts each matching claim twice, as before
+        subtopics_lower = _lowered_terms(topic_map.subtopics)
+        methods_lower = _lowered_terms(topic_map.methods)
+        if term_counts is None:
+            term_counts = _count_statements_containing(
+                chain(subtopics_lower.values(), methods_lower.values()), lowered_statements
+            )
+        subtopic_listings = Counter(topic_map.subtopics)
+        method_listings = Counter(topic_map.methods)
         
         # Identify underexplored subtopics
         min_claims = self.gap_detection_rules["coverage_thresholds"]["subtopic_min_claims"]
         for subtopic in topic_map.subtopics:
-            claim_count = len(subtopic_claims[subtopic])
+            claim_count = term_counts[subtopics_lower[subtopic]] * subtopic_listings[subtopic]
             if claim_count < min_claims:
                 gap = ResearchGap(
                     description=f"Limited research on {subtopic}",
@@ -117,15 +217,9 @@ class ResearchGapDetectionAgent(BaseAgent):
                 gaps.append(gap)
         
         # Analyze method coverage
-        method_claims = defaultdict(list)
-        for claim in claims:
-            for method in topic_map.methods:
-                if method.lower() in claim.statement.lower():
-                    method_claims[method].append(claim)
-        
         min_method_claims = self.gap_detection_rules["coverage_thresholds"]["method_min_claims"]
         for method in topic_map.methods:
-            claim_count = len(method_claims[method])
+            claim_count = term_counts[methods_lower[method]] * method_listings[method]
             if claim_count < min_method_claims:
                 gap = ResearchGap(
                     description=f"Insufficient evaluation of {method}",
@@ -142,18 +236,21 @@ class ResearchGapDetectionAgent(BaseAgent):
         
         return gaps
     
-    async def _detect_methodological_gaps(self, claims: List[Claim]) -> List[ResearchGap]:
-        """Detect gaps in research methodology."""
+    async def _detect_methodological_gaps(self, claims: List[Claim],
+                                          lowered_statements: Optional[List[str]] = None,
+                                          term_counts: Optional[Counter] = None) -> List[ResearchGap]:
+        """Detect gaps in research methodology (arguments as for _detect_coverage_gaps)."""
         gaps = []
+        if lowered_statements is None:
+            lowered_statements = [claim.statement.lower() for claim in claims]
         
         # Check for missing methodological practices
-        methodology_coverage = {}
-        for practice in self.gap_detection_rules["methodological_gaps"]:
-            coverage_count = 0
-            for claim in claims:
-                if practice.lower() in claim.statement.lower():
-                    coverage_count += 1
-            methodology_coverage[practice] = coverage_count
+        practices = self.gap_detection_rules["methodological_gaps"]
+        practices_lower = _lowered_terms(practices)
+        practice_counts = term_counts
+        if practice_counts is None:
+            practice_counts = _count_statements_containing(practices_lower.values(), lowered_statements)
+        methodology_coverage = {practice: practice_counts[practices_lower[practice]] for practice in practices}
         
         # Identify underrepresented practices
         total_claims = len(claims)
@@ -181,16 +278,13 @@ class ResearchGapDetectionAgent(BaseAgent):
         gaps = []
         
         # Analyze dataset usage
-        dataset_usage = Counter()
-        for claim in claims:
-            for dataset in claim.datasets:
-                dataset_usage[dataset] += 1
+        dataset_usage = Counter(chain.from_iterable(claim.datasets for claim in claims))
         
-        # Check if expected datasets are underused
+        # Check if expected datasets are underused (in the topic map's order, each once)
         expected_datasets = set(topic_map.datasets)
-        used_datasets = set(dataset_usage.keys())
+        used_datasets = dataset_usage.keys()
         
-        unused_datasets = expected_datasets - used_datasets
+        unused_datasets = [dataset for dataset in dict.fromkeys(topic_map.datasets) if dataset not in used_datasets]
         for dataset in unused_datasets:
             gap = ResearchGap(
                 description=f"No research found using {dataset} dataset",
@@ -243,18 +337,21 @@ class ResearchGapDetectionAgent(BaseAgent):
         
         return gaps
     
-    async def _detect_evaluation_gaps(self, claims: List[Claim]) -> List[ResearchGap]:
-        """Detect gaps in evaluation practices."""
+    async def _detect_evaluation_gaps(self, claims: List[Claim],
+                                      lowered_statements: Optional[List[str]] = None,
+                                      term_counts: Optional[Counter] = None) -> List[ResearchGap]:
+        """Detect gaps in evaluation practices (arguments as for _detect_coverage_gaps)."""
         gaps = []
+        if lowered_statements is None:
+            lowered_statements = [claim.statement.lower() for claim in claims]
         
         # Check for missing evaluation types
-        evaluation_coverage = {}
-        for eval_type in self.gap_detection_rules["evaluation_gaps"]:
-            coverage_count = 0
-            for claim in claims:
-                if eval_type.lower() in claim.statement.lower():
-                    coverage_count += 1
-            evaluation_coverage[eval_type] = coverage_count
+        eval_types = self.gap_detection_rules["evaluation_gaps"]
+        eval_types_lower = _lowered_terms(eval_types)
+        eval_counts = term_counts
+        if eval_counts is None:
+            eval_counts = _count_statements_containing(eval_types_lower.values(), lowered_statements)
+        evaluation_coverage = {eval_type: eval_counts[eval_types_lower[eval_type]] for eval_type in eval_types}
         
         # Identify missing evaluation types
         total_claims = len(claims)
@@ -279,28 +376,11 @@ class ResearchGapDetectionAgent(BaseAgent):
     
     def _calculate_priority(self, topic: str, current_count: int, expected_count: int) -> float:
         """Calculate priority score for a research gap."""
-        
-        # Base priority on how far below expected the current count is
-        deficit_ratio = (expected_count - current_count) / expected_count
-        base_priority = min(deficit_ratio, 1.0)
-        
-        # Adjust based on topic importance (simplified)
-        importance_keywords = [
-            "neural", "deep", "learning", "optimization", "evaluation",
-            "performance", "accuracy", "efficiency"
-        ]
-        
-        importance_boost = 0.0
-        for keyword in importance_keywords:
-            if keyword in topic.lower():
-                importance_boost += 0.1
-        
-        priority = min(base_priority + importance_boost, 1.0)
-        return priority
+        return _gap_priority(topic, current_count, expected_count)
     
     def _rank_gaps(self, gaps: List[ResearchGap]) -> List[ResearchGap]:
         """Rank research gaps by priority."""
-        return sorted(gaps, key=lambda g: g.priority, reverse=True)
+        return sorted(gaps, key=attrgetter('priority'), reverse=True)
     
     def get_gap_summary(self, gaps: List[ResearchGap]) -> Dict[str, Any]:
         """Get summary statistics about research gaps."""
@@ -309,15 +389,26 @@ class ResearchGapDetectionAgent(BaseAgent):
             return {"total": 0}
         
         by_type = Counter(gap.gap_type for gap in gaps)
-        priorities = [gap.priority for gap in gaps]
+        
+        # The high/medium/low buckets partition the priorities, so medium is what is left over
+        if np is not None:
+            priorities = np.fromiter((gap.priority for gap in gaps), dtype=np.float64, count=len(gaps))
+            high = int(np.count_nonzero(priorities > 0.7))
+            low = int(np.count_nonzero(priorities < 0.4))
+            avg_priority = sum(priorities.tolist()) / len(gaps)
+        else:
+            priorities = [gap.priority for gap in gaps]
+            high = sum(1 for p in priorities if p > 0.7)
+            low = sum(1 for p in priorities if p < 0.4)
+            avg_priority = sum(priorities) / len(gaps)
         
         return {
             "total": len(gaps),
             "by_type": dict(by_type),
-            "avg_priority": sum(priorities) / len(priorities),
-            "high_priority": len([p for p in priorities if p > 0.7]),
-            "medium_priority": len([p for p in priorities if 0.4 <= p <= 0.7]),
-            "low_priority": len([p for p in priorities if p < 0.4]),
+            "avg_priority": avg_priority,
+            "high_priority": high,
+            "medium_priority": len(gaps) - high - low,
+            "low_priority": low,
             "top_gaps": [
                 {
                     "description": gap.description,
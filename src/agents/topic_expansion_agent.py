@@ -7,6 +7,14 @@ from ..models.data_models import TopicMap
 from .base_agent import BaseAgent
 
 
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Words never used as search keywords
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'use', 'using'
+})
+
+
 class TopicExpansionAgent(BaseAgent):
     """Agent responsible for expanding research topics into structured maps."""
     
@@ -196,20 +204,15 @@ class TopicExpansionAgent(BaseAgent):
     
     def _extract_keywords(self, topic: str) -> List[str]:
         """Extract relevant keywords for literature search."""
-        keywords = []
         topic_lower = topic.lower()
         
         # Extract words from topic
-        words = re.findall(r'\b\w+\b', topic_lower)
-        keywords.extend(words)
+        keywords = _WORD_RE.findall(topic_lower)
         
         # Add domain-specific keywords
         for domain, keyword_list in self.domain_keywords.items():
             if any(word in topic_lower for word in domain.split('_')):
                 keywords.extend(keyword_list)
         
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'use', 'using'}
-        keywords = [kw for kw in keywords if kw not in stop_words and len(kw) > 2]
-        
-        return list(set(keywords))
\ No newline at end of file
+        # Remove common stop words and duplicates in one pass
+        return list({kw for kw in keywords if len(kw) > 2 and kw not in _STOP_WORDS})
\ No newline at end of file
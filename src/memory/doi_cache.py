@@ -0,0 +1,96 @@
+"""
+Persistent DOI cache - stores bibliographic lookups on disk so repeated runs skip CrossRef.
+"""
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Faster, more compact value encoding when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Cache files live in $CACHE_PATH, else data/cache under the repository root (not the working directory)
+DEFAULT_CACHE_DIR = Path(os.getenv("CACHE_PATH", Path(__file__).resolve().parents[2] / "data" / "cache"))
+
+
+def _encode(value: Any) -> Any:
+    """Serialize a cache value as compact JSON (bytes with orjson, str otherwise)."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(',', ':'))
+
+
+def _decode(stored: Any) -> Any:
+    """Deserialize a value written by _encode; accepts both bytes and str."""
+    if orjson is not None:
+        return orjson.loads(stored)
+    return json.loads(stored)
+
+
+class DOICache:
+    """
+    SQLite-backed key/value cache with per-entry expiry.
+
+    Values are stored as compact JSON. An empty dict is a valid value and is used to
+    record negative lookups (e.g. DOIs CrossRef does not know about), so callers
+    should test `is None` to detect a cache miss.
+    """
+
+    DEFAULT_TTL = 30 * 86400  # 30 days
+
+    def __init__(self, path: Optional[str] = None, default_ttl: int = DEFAULT_TTL):
+        self.path = Path(path) if path is not None else DEFAULT_CACHE_DIR / "crossref_cache.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at < time.time():
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+
+        return _decode(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store value under key for ttl seconds (default_ttl if not given)."""
+        expires_at = time.time() + (ttl if ttl is not None else self.default_ttl)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, _encode(value), expires_at)
+        )
+        self._conn.commit()
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store several values in a single transaction."""
+        if not items:
+            return
+        expires_at = time.time() + (ttl if ttl is not None else self.default_ttl)
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            [(key, _encode(value), expires_at) for key, value in items.items()]
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -9,9 +9,43 @@ from datetime import datetime
 import asyncio
 from pathlib import Path
 
+# Faster JSON encoding/decoding when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..models.data_models import KnowledgeNode, KnowledgeEdge
 
 
+if orjson is not None:
+    # Match json.dump(indent=2, default=str): datetimes and dataclasses go through str()
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _dump_json(data: Any, path: Path) -> None:
+    """Write data to path as indented JSON, stringifying unsupported objects."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=_ORJSON_OPTIONS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
+
+def _load_json(path: Path) -> Any:
+    """Read JSON written by _dump_json."""
+    with open(path, 'rb') as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+
 class MemoryStore:
     """Persistent memory store for research data."""
     
@@ -132,8 +166,7 @@ class MemoryStore:
             
             # Use pickle for complex objects, JSON for simple ones
             if isinstance(data, (str, int, float, bool, list, dict)):
-                with open(file_path.with_suffix('.json'), 'w') as f:
-                    json.dump(data, f, indent=2, default=str)
+                _dump_json(data, file_path.with_suffix('.json'))
             else:
                 with open(file_path, 'wb') as f:
                     pickle.dump(data, f)
@@ -147,8 +180,7 @@ class MemoryStore:
             # Try JSON first
             json_path = self.storage_path / f"{key}.json"
             if json_path.exists():
-                with open(json_path, 'r') as f:
-                    return json.load(f)
+                return _load_json(json_path)
             
             # Try pickle
             pkl_path = self.storage_path / f"{key}.pkl"
@@ -175,8 +207,7 @@ class MemoryStore:
                 for node_id, node in self.knowledge_graph.items()
             }
             
-            with open(self.storage_path / "knowledge_nodes.json", 'w') as f:
-                json.dump(nodes_data, f, indent=2, default=str)
+            _dump_json(nodes_data, self.storage_path / "knowledge_nodes.json")
             
             # Save edges
             edges_data = [
@@ -190,8 +221,7 @@ class MemoryStore:
                 for edge in self.edges
             ]
             
-            with open(self.storage_path / "knowledge_edges.json", 'w') as f:
-                json.dump(edges_data, f, indent=2, default=str)
+            _dump_json(edges_data, self.storage_path / "knowledge_edges.json")
         
         except Exception as e:
             print(f"Error persisting knowledge graph: {e}")
@@ -202,8 +232,7 @@ class MemoryStore:
             # Load knowledge nodes
             nodes_path = self.storage_path / "knowledge_nodes.json"
             if nodes_path.exists():
-                with open(nodes_path, 'r') as f:
-                    nodes_data = json.load(f)
+                nodes_data = _load_json(nodes_path)
                 
                 for node_id, node_data in nodes_data.items():
                     node = KnowledgeNode(
@@ -217,8 +246,7 @@ class MemoryStore:
             # Load knowledge edges
             edges_path = self.storage_path / "knowledge_edges.json"
             if edges_path.exists():
-                with open(edges_path, 'r') as f:
-                    edges_data = json.load(f)
+                edges_data = _load_json(edges_path)
                 
                 for edge_data in edges_data:
                     edge = KnowledgeEdge(
@@ -2,7 +2,7 @@
 Data models for the Autonomous Research Agent System.
 """
 from typing import List, Dict, Optional, Any, Set
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 from enum import Enum
 
@@ -26,6 +26,10 @@ class PaperMetadata(BaseModel):
     url: Optional[str] = None
     relevance_score: float = 0.0
     impact_score: float = 0.0
+    
+    # Lowercased title/abstract, filled in by PaperDiscoveryAgent before ranking
+    _title_lc: Optional[str] = PrivateAttr(default=None)
+    _abstract_lc: Optional[str] = PrivateAttr(default=None)
 
 
 class Claim(BaseModel):
@@ -173,7 +177,10 @@ class LiteratureDocument(BaseModel):
     
     @property
     def total_citations(self) -> int:
-        return len(set(citation for section in self.sections for citation in section.citations))
+        seen = set()
+        for section in self.sections:
+            seen.update(section.citations)
+        return len(seen)
 
 
 class LiteratureFilter(BaseModel):
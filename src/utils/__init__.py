@@ -0,0 +1,3 @@
+"""
+Shared utilities for the Autonomous Research Agent System.
+"""
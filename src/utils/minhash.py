@@ -0,0 +1,26 @@
+"""
+MinHash helpers for near-duplicate title detection, shared by the agents.
+"""
+from functools import lru_cache
+
+# datasketch is optional; callers check MinHashLSH before using these helpers
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = MinHashLSH = None
+
+
+@lru_cache(maxsize=None)
+def _empty_minhash(num_perm: int):
+    """Empty MinHash whose permutations are shared by every title hash of that size."""
+    return MinHash(num_perm=num_perm)
+
+
+def title_minhash(normalized_title: str, shingle_size: int, num_perm: int):
+    """MinHash of the title's character shingles of the given size."""
+    minhash = _empty_minhash(num_perm).copy()
+    last = max(len(normalized_title) - shingle_size + 1, 1)
+    minhash.update_batch([
+        normalized_title[i:i + shingle_size].encode('utf-8') for i in range(last)
+    ])
+    return minhash
@@ -3,7 +3,7 @@ Tests for the Autonomous Research Agent System.
 """
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, MagicMock
 
 from src.research_system import AutonomousResearchSystem
 from src.models.data_models import TopicMap, PaperMetadata, Claim
@@ -169,5 +169,356 @@ class TestClaimExtractionAgent:
         assert "second sentence" in sentences[1]
 
 
+class TestPaperDiscoveryAgent:
+    """Test cases for paper deduplication and ranking in the Paper Discovery Agent."""
+    
+    @pytest.fixture
+    def paper_discovery_agent(self):
+        """Create a paper discovery agent for testing."""
+        from src.agents.paper_discovery_agent import PaperDiscoveryAgent
+        return PaperDiscoveryAgent()
+    
+    @staticmethod
+    def make_paper(title, **fields):
+        """Create a paper with placeholder metadata."""
+        data = dict(title=title, authors=["John Doe"], year=2020, venue="arXiv", abstract="")
+        data.update(fields)
+        return PaperMetadata(**data)
+    
+    def test_identifier_matches_merge(self):
+        """Test that papers sharing an arXiv id or DOI (any case) are merged."""
+        from src.agents.paper_discovery_agent import _PaperDeduplicator
+        deduplicator = _PaperDeduplicator()
+        
+        deduplicator.add_all([
+            self.make_paper("Graph Attention Networks", arxiv_id="1710.10903"),
+            self.make_paper("GAT: attention on graphs", arxiv_id="1710.10903"),
+            self.make_paper("Deep learning", doi="10.1038/nature14539"),
+            self.make_paper("Deep learning review", doi="10.1038/NATURE14539")
+        ])
+        
+        assert [paper.title for paper in deduplicator.papers] == ["Graph Attention Networks", "Deep learning"]
+    
+    def test_normalized_title_matches_merge(self):
+        """Test that titles differing only in case, punctuation and articles are merged."""
+        from src.agents.paper_discovery_agent import _PaperDeduplicator
+        deduplicator = _PaperDeduplicator()
+        
+        deduplicator.add_all([
+            self.make_paper("Graph Attention Networks"),
+            self.make_paper("The graph attention networks."),
+            self.make_paper("Molecular Property Prediction")
+        ])
+        
+        assert [paper.title for paper in deduplicator.papers] == ["Graph Attention Networks", "Molecular Property Prediction"]
+    
+    def test_richest_record_kept_in_first_position(self):
+        """Test that a duplicate with more metadata replaces the first record in place."""
+        from src.agents.paper_discovery_agent import _PaperDeduplicator
+        deduplicator = _PaperDeduplicator()
+        sparse = self.make_paper("Graph Attention Networks")
+        other = self.make_paper("Molecular Property Prediction")
+        rich = self.make_paper(
+            "Graph attention networks", authors=["Petar Velickovic", "Guillem Cucurull"],
+            abstract="We present graph attention networks.", doi="10.48550/arXiv.1710.10903"
+        )
+        
+        deduplicator.add_all([sparse, other, rich, self.make_paper("Graph Attention Networks!")])
+        
+        assert deduplicator.papers == [rich, other]
+    
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_rank_papers_matches_reference_formula(self, paper_discovery_agent, monkeypatch, use_numpy):
+        """Test that relevance scores equal the original per-paper formula."""
+        from datetime import datetime
+        from src.agents import paper_discovery_agent as module
+        if not use_numpy:
+            monkeypatch.setattr(module, "np", None)
+        topic_map = TopicMap(
+            main_topic="Graph Neural Networks",
+            subtopics=[],
+            methods=[],
+            datasets=[],
+            keywords=["graph", "molecular", "Graph"]
+        )
+        current_year = datetime.now().year
+        papers = [
+            self.make_paper("Graph Neural Networks for molecules", year=current_year - 1, venue="NeurIPS",
+                            abstract="Molecular graph neural networks."),
+            self.make_paper("Molecular property prediction", year=current_year - 4,
+                            abstract="Graph models for molecular data."),
+            self.make_paper("Unrelated work", year=current_year - 10, venue="Science"),
+            self.make_paper("Preset score", relevance_score=0.42)
+        ]
+        
+        def reference_score(paper):
+            title, abstract = paper.title.lower(), paper.abstract.lower()
+            score = 0.3 * (topic_map.main_topic.lower() in title) + 0.2 * (topic_map.main_topic.lower() in abstract)
+            for keyword in topic_map.keywords:
+                score += 0.1 * (keyword.lower() in title) + 0.05 * (keyword.lower() in abstract)
+            if current_year - paper.year <= 5:
+                score += 0.1 * (6 - (current_year - paper.year)) / 5
+            if any(venue in paper.venue for venue in ["Nature", "Science", "ICLR", "NeurIPS", "ICML", "AAAI"]):
+                score += 0.2
+            return min(score, 1.0)
+        
+        expected = [reference_score(paper) for paper in papers[:3]] + [0.42]
+        
+        ranked = paper_discovery_agent._rank_papers(papers, topic_map)
+        
+        assert [paper.relevance_score for paper in papers] == pytest.approx(expected)
+        assert all(type(paper.relevance_score) is float for paper in papers)
+        assert [paper.relevance_score for paper in ranked] == sorted(
+            (paper.relevance_score for paper in papers), reverse=True
+        )
+
+
+class TestDOICache:
+    """Test cases for the persistent DOI cache."""
+    
+    def test_round_trip_and_negative_entries(self, tmp_path):
+        """Test that hits, negative lookups and misses are distinguishable."""
+        from src.memory.doi_cache import DOICache
+        cache = DOICache(str(tmp_path / "cache.sqlite"))
+        
+        cache.set("10.1000/found", {"volume": "12", "issue": "3"})
+        cache.set_many({"10.1000/missing": {}})
+        
+        assert cache.get("10.1000/found") == {"volume": "12", "issue": "3"}
+        assert cache.get("10.1000/missing") == {}
+        assert cache.get("10.1000/unknown") is None
+        cache.close()
+    
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test that entries past their TTL are not returned."""
+        from src.memory.doi_cache import DOICache
+        cache = DOICache(str(tmp_path / "cache.sqlite"))
+        
+        cache.set("10.1000/stale", {"volume": "1"}, ttl=-1)
+        
+        assert cache.get("10.1000/stale") is None
+        cache.close()
+
+
+class TestLiteratureBuilderAgent:
+    """Test cases for CrossRef volume lookups in the Literature Builder Agent."""
+    
+    @pytest.fixture
+    def literature_builder_agent(self, tmp_path):
+        """Create a literature builder with a throwaway DOI cache."""
+        from src.agents.literature_builder_agent import LiteratureBuilderAgent
+        agent = LiteratureBuilderAgent(cache_path=str(tmp_path / "cache.sqlite"))
+        yield agent
+        agent.close()
+    
+    @staticmethod
+    def crossref_session(status, payload=None):
+        """Mock aiohttp session whose every GET answers with status and JSON payload."""
+        response = Mock(status=status)
+        response.json = AsyncMock(return_value=payload)
+        session = MagicMock()
+        session.get.return_value.__aenter__.return_value = response
+        return session
+    
+    @pytest.mark.asyncio
+    async def test_batch_response_parsed_and_absent_dois_recorded(self, literature_builder_agent):
+        """Test that one filter=doi: response resolves found DOIs and marks the rest as unknown."""
+        payload = {'message': {'items': [
+            {'DOI': '10.1038/NATURE14539', 'volume': '521', 'issue': '7553', 'page': '436-444'}
+        ]}}
+        session = self.crossref_session(200, payload)
+        
+        fetched, failed = await literature_builder_agent._fetch_crossref_batch_async(
+            session, ['10.1038/nature14539', '10.1000/unknown']
+        )
+        
+        assert fetched == {
+            '10.1038/nature14539': {'volume': '521', 'issue': '7553', 'pages': '436-444', 'article_number': None},
+            '10.1000/unknown': {}
+        }
+        assert failed == []
+        assert session.get.call_args.kwargs['params']['filter'] == 'doi:10.1038/nature14539,doi:10.1000/unknown'
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_retried_per_doi(self, literature_builder_agent):
+        """Test that DOIs of a failed batch are retried one by one and failed lookups are dropped."""
+        session = self.crossref_session(503)
+        session_cm = MagicMock()
+        session_cm.__aenter__.return_value = session
+        literature_builder_agent._open_crossref_session = Mock(return_value=session_cm)
+        info = {'volume': '1', 'issue': None, 'pages': None, 'article_number': None}
+        literature_builder_agent._fetch_crossref_work_async = AsyncMock(
+            side_effect=lambda session, semaphore, doi: info if doi == '10.1000/a' else None
+        )
+        
+        fetched = await literature_builder_agent._fetch_crossref_dois(['10.1000/a', '10.1000/b'])
+        
+        assert fetched == {'10.1000/a': info}
+        retried = [call.args[2] for call in literature_builder_agent._fetch_crossref_work_async.await_args_list]
+        assert retried == ['10.1000/a', '10.1000/b']
+    
+    @pytest.mark.asyncio
+    async def test_bibliography_writes_through_doi_cache(self, literature_builder_agent):
+        """Test that fetched volume info is cached and cached DOIs are not fetched again."""
+        info = {'volume': '521', 'issue': '7553', 'pages': '436-444', 'article_number': None}
+        literature_builder_agent._fetch_crossref_dois = AsyncMock(return_value={'10.1038/nature14539': info})
+        paper = PaperMetadata(title="Deep learning", authors=["Yann LeCun"], year=2015, venue="Nature",
+                              abstract="", doi="https://doi.org/10.1038/NATURE14539")
+        
+        first = await literature_builder_agent._generate_bibliography([paper])
+        second = await literature_builder_agent._generate_bibliography([paper])
+        
+        assert literature_builder_agent._doi_cache.get('10.1038/nature14539') == info
+        assert [call.args[0] for call in literature_builder_agent._fetch_crossref_dois.await_args_list] == [
+            ['10.1038/nature14539'], []
+        ]
+        assert first == second
+        assert "\\textbf{521}(7553) (2015) 436-444" in first[0]
+
+
+class TestReferenceValidator:
+    """Test cases for the Reference Validator."""
+    
+    @pytest.fixture
+    def reference_validator(self):
+        """Create a reference validator without a disk cache."""
+        from src.agents.reference_validator import ReferenceValidator
+        validator = ReferenceValidator(cache_path=None)
+        yield validator
+        validator.close()
+    
+    @pytest.mark.asyncio
+    async def test_fieldless_plain_references_are_not_duplicates(self, reference_validator):
+        """Test that plain references with no parsed fields are all kept."""
+        from src.agents.reference_validator import ReferenceValidationResult
+        content = "Smith, A study of things. Nature.\nJones, Another work entirely. Science."
+        references = await reference_validator._parse_references(content, 'plain')
+        result = ReferenceValidationResult()
+        
+        unique = await reference_validator._remove_duplicates(references, result)
+        
+        assert len(unique) == 2
+        assert result.duplicates_removed == []
+    
+    @pytest.mark.asyncio
+    async def test_internal_signatures_do_not_leak_into_results(self, reference_validator):
+        """Test that duplicate detection leaves no internal keys on returned references."""
+        verification = {
+            'is_valid': True, 'checks_performed': [], 'issues_found': [],
+            'verified_data': {}, 'search_method': 'stub', 'corrections_made': []
+        }
+        reference_validator._batch_search_by_doi = AsyncMock(return_value={})
+        reference_validator._verify_single_paper = AsyncMock(return_value=verification)
+        content = """
+@article{lecun2015,
+  title={Deep learning},
+  author={LeCun, Yann and Bengio, Yoshua},
+  journal={Nature},
+  year={2015}
+}
+
+@article{lecun2015dup,
+  title={Deep learning},
+  author={LeCun, Yann and Bengio, Yoshua},
+  journal={Nature},
+  year={2015}
+}
+"""
+        
+        result = await reference_validator.process_reference_file(content, 'bibtex')
+        
+        returned = result.corrected_references + [entry['reference'] for entry in result.duplicates_removed]
+        assert len(result.corrected_references) == 1
+        assert len(result.duplicates_removed) == 1
+        assert not any('_sig' in ref for ref in returned)
+    
+    @pytest.mark.asyncio
+    async def test_identical_references_match_exactly(self, reference_validator):
+        """Test that a repeated reference is removed as a duplicate of the first."""
+        from src.agents.reference_validator import ReferenceValidationResult
+        ref = {'key': 'a', 'title': 'Deep learning', 'authors': 'Y. LeCun, G. Hinton', 'year': 2015}
+        result = ReferenceValidationResult()
+        
+        unique = await reference_validator._remove_duplicates([ref, dict(ref, key='b')], result)
+        
+        assert [r['key'] for r in unique] == ['a']
+        assert result.duplicates_removed[0]['similar_to_index'] == 0
+        assert result.duplicates_removed[0]['similarity_score'] == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_near_duplicates_found_within_block(self, reference_validator):
+        """Test fuzzy matching among references sharing a (last name, year) block."""
+        from src.agents.reference_validator import ReferenceValidationResult
+        references = [
+            {'key': 'a', 'title': 'Deep learning', 'authors': 'Y. LeCun', 'year': 2015, 'journal': 'Nature'},
+            {'key': 'b', 'title': 'Attention is all you need', 'authors': 'A. Vaswani', 'year': 2017},
+            {'key': 'c', 'title': 'Deep learning.', 'authors': 'Yann LeCun', 'year': 2015, 'journal': 'Nature 521'}
+        ]
+        result = ReferenceValidationResult()
+        
+        unique = await reference_validator._remove_duplicates(references, result)
+        
+        assert [r['key'] for r in unique] == ['a', 'b']
+        assert result.duplicates_removed[0]['similar_to_index'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_large_files_match_titles_through_lsh(self, reference_validator, monkeypatch):
+        """Test that the MinHash-LSH path replaces blocking for large files."""
+        pytest.importorskip("datasketch")
+        from src.agents import reference_validator as module
+        monkeypatch.setattr(module, "_LSH_MIN_REFERENCES", 0)
+        monkeypatch.setattr(reference_validator, "_candidate_indices", Mock(side_effect=AssertionError))
+        references = [
+            {'key': 'a', 'title': 'Graph neural networks for drug discovery', 'authors': 'J. Doe', 'year': 2023},
+            {'key': 'b', 'title': 'Molecular property prediction with graph attention', 'authors': 'A. Johnson', 'year': 2022},
+            {'key': 'c', 'title': 'Graph neural networks for drug discovery', 'authors': 'J. Doe', 'year': 2023, 'journal': 'Nature'}
+        ]
+        result = module.ReferenceValidationResult()
+        
+        unique = await reference_validator._remove_duplicates(references, result)
+        
+        assert [r['key'] for r in unique] == ['a', 'b']
+        assert result.duplicates_removed[0]['similar_to_index'] == 0
+    
+    def test_spelling_batch_matches_single_corrections(self, reference_validator):
+        """Test that batched spelling correction equals correcting each title alone."""
+        titles = ["Deep learing for image recogntion", None, "", "Graph netowrk anaylsis", "No mistakes here"]
+        
+        corrected = reference_validator._correct_spelling_batch(titles)
+        
+        assert corrected == [reference_validator._correct_spelling(title) for title in titles]
+        assert corrected[0] == "Deep learning for image recognition"
+        assert corrected[1] is None
+    
+    @pytest.mark.asyncio
+    async def test_batch_doi_search_caches_hits_and_misses(self, reference_validator):
+        """Test that one filter=doi: request answers every DOI and later lookups are cached."""
+        work = {'DOI': '10.1000/FOUND', 'title': ['Found paper']}
+        reference_validator._crossref_get = AsyncMock(return_value=(200, {'message': {'items': [work]}}))
+        
+        found = await reference_validator._batch_search_by_doi(['10.1000/found', '10.1000/missing'])
+        await reference_validator._batch_search_by_doi(['10.1000/found', '10.1000/missing'])
+        
+        assert found == {'10.1000/found': work}
+        assert reference_validator._crossref_get.await_count == 1
+        params = reference_validator._crossref_get.await_args.args[2]
+        assert params['filter'] == 'doi:10.1000/found,doi:10.1000/missing'
+        assert reference_validator._cached_response('doi:10.1000/found') == (200, {'message': work})
+        assert reference_validator._cached_response('doi:10.1000/missing') == (404, None)
+    
+    def test_bibtex_fields_braced_quoted_and_bare(self):
+        """Test BibTeX field scanning across value styles."""
+        from src.agents.reference_validator import _iter_bibtex_fields
+        fields = 'title={Deep {L}earning}, author = "LeCun, Yann", year = 2015, note = {}, pages={436--444}'
+        
+        assert list(_iter_bibtex_fields(fields)) == [
+            ('title', 'Deep {L}earning'),
+            ('author', 'LeCun, Yann'),
+            ('year', '2015'),
+            ('pages', '436--444')
+        ]
+        assert list(_iter_bibtex_fields('title={Unclosed, year=2015')) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file